@@ -0,0 +1,12 @@
+-- Migration 010: Keyset pagination indexes for job lists
+-- VISP-BE-JOBS-002
+--
+-- Job list endpoints page by (created_at DESC, id DESC).  These composite
+-- indexes let a keyset cursor seek straight to the next page instead of
+-- scanning and discarding OFFSET rows.
+
+CREATE INDEX IF NOT EXISTS idx_jobs_customer_created_id
+    ON jobs (customer_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_created_id
+    ON jobs (created_at DESC, id DESC);
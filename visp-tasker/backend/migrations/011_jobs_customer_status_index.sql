@@ -0,0 +1,9 @@
+-- Migration 011: Customer active-jobs index
+-- VISP-BE-JOBS-002
+--
+-- GET /jobs/active filters on customer_id and a positive status IN (...)
+-- list, newest first.  This composite index serves both predicates and
+-- the created_at ordering without touching terminal-status rows.
+
+CREATE INDEX IF NOT EXISTS idx_jobs_customer_status_created
+    ON jobs (customer_id, status, created_at DESC);
@@ -0,0 +1,10 @@
+-- Migration 012: Optimistic locking for jobs
+-- VISP-BE-JOBS-002
+--
+-- SQLAlchemy uses jobs.version as its version_id_col: every UPDATE adds
+-- "AND version = :old" and bumps the counter.  A status change that loses
+-- a race updates zero rows and is rejected with 409 instead of silently
+-- overwriting the winner.
+
+ALTER TABLE jobs
+    ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
@@ -0,0 +1,82 @@
+-- Migration 013: Create notifications and notification_preferences tables
+-- VISP-INT-NOTIFICATIONS-003 -- In-app notification history and preferences
+--
+-- These tables were previously only created by the ORM's create_all, so a
+-- database built from these migrations had no notifications table and the
+-- index migrations that follow failed.  Everything here is IF NOT EXISTS so
+-- databases that already have the tables are left untouched.
+
+-- Notification type enum.  Labels are the NotificationType member names,
+-- which is what the ORM's Enum column writes (as in 002 and 005).
+DO $$ BEGIN
+    CREATE TYPE notification_type AS ENUM (
+        'JOB_OFFERED',
+        'JOB_ACCEPTED',
+        'JOB_STARTED',
+        'JOB_COMPLETED',
+        'JOB_CANCELLED',
+        'PROVIDER_EN_ROUTE',
+        'SLA_WARNING',
+        'EMERGENCY_ALERT',
+        'CREDENTIAL_EXPIRY',
+        'PAYMENT_RECEIVED',
+        'PAYOUT_SENT',
+        'CHAT_MESSAGE',
+        'SYSTEM'
+    );
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END $$;
+
+-- Notification history
+CREATE TABLE IF NOT EXISTS notifications (
+    id                  UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id             UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    title               VARCHAR(255) NOT NULL,
+    body                TEXT NOT NULL,
+    notification_type   notification_type NOT NULL,
+    data_json           JSONB,
+    read                BOOLEAN NOT NULL DEFAULT FALSE,
+    read_at             TIMESTAMPTZ,
+    sent_at             TIMESTAMPTZ,
+    created_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_notifications_user_id
+    ON notifications (user_id);
+CREATE INDEX IF NOT EXISTS ix_notifications_user_unread
+    ON notifications (user_id, read);
+CREATE INDEX IF NOT EXISTS ix_notifications_user_created
+    ON notifications (user_id, created_at);
+CREATE INDEX IF NOT EXISTS ix_notifications_type
+    ON notifications (notification_type);
+
+DROP TRIGGER IF EXISTS trg_notifications_updated_at ON notifications;
+CREATE TRIGGER trg_notifications_updated_at
+    BEFORE UPDATE ON notifications
+    FOR EACH ROW
+    EXECUTE FUNCTION set_updated_at();
+
+-- Per-user notification preferences (at most one row per user)
+CREATE TABLE IF NOT EXISTS notification_preferences (
+    id                  UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id             UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    job_updates         BOOLEAN NOT NULL DEFAULT TRUE,
+    payment_updates     BOOLEAN NOT NULL DEFAULT TRUE,
+    marketing           BOOLEAN NOT NULL DEFAULT FALSE,
+    sla_warnings        BOOLEAN NOT NULL DEFAULT TRUE,
+    emergency_alerts    BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at          TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_notification_preferences_user_id
+    ON notification_preferences (user_id);
+
+DROP TRIGGER IF EXISTS trg_notification_preferences_updated_at
+    ON notification_preferences;
+CREATE TRIGGER trg_notification_preferences_updated_at
+    BEFORE UPDATE ON notification_preferences
+    FOR EACH ROW
+    EXECUTE FUNCTION set_updated_at();
@@ -0,0 +1,12 @@
+-- Migration 014: Keyset pagination index for notification history
+-- VISP-INT-NOTIFICATIONS-003
+--
+-- Notification history pages by (created_at DESC, id DESC), optionally with a
+-- keyset cursor.  This index lets both OFFSET pages and cursors read a user's
+-- notifications in order without a sort, and supersedes the two-column
+-- (user_id, created_at) index.
+
+CREATE INDEX IF NOT EXISTS ix_notifications_user_created_id
+    ON notifications (user_id, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS ix_notifications_user_created;
@@ -0,0 +1,19 @@
+-- Migration 015: Partial index for unread notifications
+-- VISP-INT-NOTIFICATIONS-003
+--
+-- The unread-count endpoint and the unread_only history filter both look
+-- up user_id = ? AND read = false.  A partial index holds only unread rows,
+-- so it stays small and lets the count run as an index-only scan.  Its key
+-- order matches the history ordering, so unread pages need no sort.  It
+-- replaces the full (user_id, read) index.
+--
+-- scripts/migrate.py applies migrations inside a transaction, so the index
+-- is built without CONCURRENTLY (which cannot run in a transaction block).
+
+CREATE INDEX IF NOT EXISTS ix_notifications_user_unread_created
+    ON notifications (user_id, created_at DESC, id DESC)
+    WHERE read = false;
+
+DROP INDEX IF EXISTS ix_notifications_user_unread;
+
+ANALYZE notifications;
@@ -13,32 +13,17 @@ from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.config import settings
+from src.core.database import async_session_factory, engine  # noqa: F401
 
 # ---------------------------------------------------------------------------
-# Async engine & session factory
+# Database session dependency
 # ---------------------------------------------------------------------------
-# The engine is created once at module import time.  The session factory
-# produces lightweight ``AsyncSession`` instances that are scoped to a single
-# request via the ``get_db`` dependency below.
+# ``engine`` and ``async_session_factory`` live in ``src.core.database`` and
+# are re-exported here for existing route imports.
 # ---------------------------------------------------------------------------
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.sql_echo,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
-    pool_pre_ping=True,
-)
-
-async_session_factory = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
-
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield an async database session that is automatically closed after the
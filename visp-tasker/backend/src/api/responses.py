@@ -0,0 +1,101 @@
+"""
+Shared response helpers for the VISP/Tasker API routes.
+
+Provides the ``{"data": ...}`` envelope that mobile-facing endpoints return,
+rendered straight to JSON bytes by pydantic-core, and ETag handling for
+endpoints that clients poll.
+
+Datetimes render as pydantic does for ``response_model`` routes: RFC 3339
+with a ``Z`` suffix for UTC (``2026-01-01T00:00:00Z``).  Routes pass
+datetime objects rather than pre-formatted strings so every endpoint uses
+that one format.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+# ``{"data": ...}`` envelope serialised straight to JSON bytes, so validated
+# models inside it are dumped in the same pydantic-core pass as the rest of
+# the payload.
+_DATA_ENVELOPE: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
+def render_data(data: Any) -> bytes:
+    """Render ``{"data": data}`` to JSON bytes, dumping models by alias."""
+    return _DATA_ENVELOPE.dump_json({"data": data}, by_alias=True)
+
+
+def data_response(
+    data: Any, *, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Render ``{"data": data}`` to JSON bytes in one pydantic-core pass.
+
+    Models inside *data* are dumped by alias; the result bypasses FastAPI's
+    ``jsonable_encoder`` and stdlib ``json.dumps``.
+    """
+    return Response(
+        content=render_data(data),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def body_etag(body: bytes) -> str:
+    """Weak ETag derived from a rendered response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def version_etag(*parts: Any) -> str:
+    """Weak ETag derived from version markers rather than a rendered body.
+
+    Lets an endpoint validate a client's copy from a cheap probe (a row's
+    ``updated_at``, a max timestamp and count, the query string) before
+    running the query that builds the body.
+    """
+    raw = "|".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of *etag* against an ``If-None-Match`` header value."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """A bodiless 304 if the client's ``If-None-Match`` matches *etag*, else None."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
+
+
+def conditional_json_response(
+    request: Request, body: bytes, *, etag: str | None = None
+) -> Response:
+    """Serve a rendered JSON body with an ETag, honouring ``If-None-Match``.
+
+    The ETag defaults to a hash of *body*.  When the client already holds
+    this exact body, a bodiless 304 is returned instead.
+    """
+    if etag is None:
+        etag = body_etag(body)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
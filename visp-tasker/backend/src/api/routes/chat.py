@@ -19,6 +19,7 @@ for the given job.
 
 from __future__ import annotations
 
+import logging
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -37,8 +38,11 @@ from src.api.schemas.chat import (
     UnreadCountData,
     UnreadCountResponse,
 )
+from src.realtime.socketServer import broadcast_to_job
 from src.services import chatService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/jobs", tags=["Chat"])
 
 
@@ -172,8 +176,6 @@ async def send_message(
 
     # Best-effort: broadcast via WebSocket to the job room
     try:
-        from src.realtime.socketServer import broadcast_to_job
-
         await broadcast_to_job(
             str(job_id),
             "chat:new_message",
@@ -191,8 +193,7 @@ async def send_message(
     except Exception:
         # WebSocket broadcast is best-effort; the REST response is the
         # source of truth.  Log but do not fail the request.
-        import logging
-        logging.getLogger(__name__).warning(
+        logger.warning(
             "Failed to broadcast chat:new_message via WebSocket for job=%s",
             job_id,
             exc_info=True,
@@ -250,8 +251,6 @@ async def mark_messages_read(
     # Best-effort: broadcast read receipt via WebSocket
     if updated > 0:
         try:
-            from src.realtime.socketServer import broadcast_to_job
-
             await broadcast_to_job(
                 str(job_id),
                 "chat:messages_read",
@@ -20,22 +20,25 @@ Routes:
 from __future__ import annotations
 
 import logging
+import math
 import uuid
-from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.orm import raiseload, selectinload
 
-from src.api.deps import CurrentUser, DBSession
+from src.api.deps import CurrentUser, DBSession, async_session_factory
+from src.api.responses import conditional_json_response, data_response, render_data
 from src.api.schemas.job import (
+    CursorPaginationMeta,
     JobBrief,
     JobCancelRequest,
     JobCreateRequest,
     JobListResponse,
     JobOut,
     JobStatusUpdateRequest,
-    PaginationMeta,
 )
 from src.api.schemas.provider import (
     EstimatedPriceOut,
@@ -46,12 +49,97 @@ from src.api.schemas.provider import (
     MobileJobStatusUpdateRequest,
 )
 from src.core.config import settings
-from src.services import jobService
+from src.models.job import AssignmentStatus, Job, JobStatus
+from src.realtime.socketServer import get_redis
+from src.services import jobService, providerService
+from src.services.matchingEngine import assign_provider, find_matching_providers
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# Page-size bounds resolved once at import so Query defaults are plain ints.
+_DEFAULT_PAGE_SIZE: int = int(settings.default_page_size)
+_MAX_PAGE_SIZE: int = int(settings.max_page_size)
+
+# Tracking payloads are cached briefly because mobile clients poll the
+# endpoint every few seconds; the TTL matches the provider location
+# update throttle, so a cached payload is never older than one update.
+_TRACKING_CACHE_PREFIX: str = "visp:jobs:tracking:"
+_TRACKING_CACHE_TTL_SECONDS: int = 3
+
+# Statuses that end a job's lifecycle; anything else counts as "active".
+# Kept as a module-level tuple so the statement shape is stable per request.
+_TERMINAL_STATUSES: tuple[JobStatus, ...] = (
+    JobStatus.COMPLETED,
+    JobStatus.CANCELLED_BY_CUSTOMER,
+    JobStatus.CANCELLED_BY_PROVIDER,
+    JobStatus.CANCELLED_BY_SYSTEM,
+    JobStatus.DISPUTED,
+    JobStatus.REFUNDED,
+)
+
+# The complement, used as a positive ``status IN (...)`` predicate so the
+# planner can use idx_jobs_customer_status_created.
+_ACTIVE_STATUSES: tuple[JobStatus, ...] = tuple(
+    s for s in JobStatus if s not in _TERMINAL_STATUSES
+)
+
+# Rows buffered per partition when streaming the active-jobs page.
+# Assignments stay on selectinload (one IN query per partition); a
+# joinedload on that collection would multiply rows and need .unique().
+# Every other relationship is raiseload, so a lazy load added to the
+# serializer fails loudly instead of issuing a query per row.
+_ACTIVE_JOBS_YIELD_PER: int = 100
+
+# Mobile status -> internal status, keyed by (mobile_status, actor_type).
+# A ``None`` actor is the default for statuses that do not depend on who
+# is making the change; only cancellation differs by actor.
+_MOBILE_STATUS_MAP: dict[tuple[str, str | None], str] = {
+    ("cancelled", "customer"): "cancelled_by_customer",
+    ("cancelled", "provider"): "cancelled_by_provider",
+    ("cancelled", "admin"): "cancelled_by_system",
+    ("cancelled", "system"): "cancelled_by_system",
+    ("en_route", None): "provider_en_route",
+    ("arrived", None): "in_progress",  # Map arrived to in_progress for now
+    ("in_progress", None): "in_progress",
+    ("completed", None): "completed",
+}
+
+# List adapters built once so list endpoints validate a whole page in a
+# single pydantic-core call instead of one model_validate per row.
+_JOB_BRIEF_LIST: TypeAdapter[list[JobBrief]] = TypeAdapter(list[JobBrief])
+_MOBILE_JOB_LIST: TypeAdapter[list[MobileJobOut]] = TypeAdapter(list[MobileJobOut])
+
+# Assignment statuses that mark the provider currently attached to a job.
+_ACTIVE_ASSIGNMENT_STATUSES: frozenset[AssignmentStatus] = frozenset(
+    {AssignmentStatus.OFFERED, AssignmentStatus.ACCEPTED}
+)
+
+# Assignment timestamp attributes and their camelCase keys in the job detail.
+_ASSIGNMENT_TIME_FIELDS: tuple[tuple[str, str], ...] = (
+    ("offeredAt", "offered_at"),
+    ("respondedAt", "responded_at"),
+    ("slaResponseDeadline", "sla_response_deadline"),
+    ("slaArrivalDeadline", "sla_arrival_deadline"),
+)
+
+
+# MobileJobOut fields, copied attribute-for-attribute from a Job.
+_MOBILE_JOB_FIELDS: tuple[str, ...] = tuple(MobileJobOut.model_fields)
+
+
+def _job_to_mobile_out(job: Job) -> MobileJobOut:
+    """Build a MobileJobOut from a job this request just wrote, unvalidated.
+
+    The ORM row already satisfies the schema; only the two enum columns need
+    converting to their string values.
+    """
+    fields = {name: getattr(job, name) for name in _MOBILE_JOB_FIELDS}
+    fields["status"] = job.status.value
+    fields["priority"] = job.priority.value
+    return MobileJobOut.model_construct(**fields)
+
 
 # ---------------------------------------------------------------------------
 # POST /api/v1/jobs -- Create a new job
@@ -92,6 +180,37 @@ async def create_job(
     return JobOut.model_validate(job)
 
 
+# ---------------------------------------------------------------------------
+# Background matching
+# ---------------------------------------------------------------------------
+
+async def _match_and_assign(job_id: uuid.UUID) -> None:
+    """Find the best provider for a freshly booked job and offer it to them.
+
+    Runs as a background task after the booking response has been sent,
+    on its own session.  Best-effort for MVP: failures are logged and the
+    job simply stays in PENDING_MATCH.
+    """
+    async with async_session_factory() as db:
+        try:
+            job = await jobService.get_job(db, job_id)
+            if job is None:
+                return
+            match_result = await find_matching_providers(db, job, max_results=1)
+            if match_result["matches"]:
+                best = match_result["matches"][0]
+                await assign_provider(
+                    db,
+                    job.id,
+                    best["provider_id"],
+                    match_score=float(best["composite_score"]),
+                )
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.warning("Auto-matching failed for job %s: %s", job_id, exc)
+
+
 # ---------------------------------------------------------------------------
 # POST /api/v1/jobs/book -- Mobile-friendly job booking
 # ---------------------------------------------------------------------------
@@ -103,14 +222,16 @@ async def create_job(
     description=(
         "Mobile-friendly endpoint for booking a job. Uses camelCase request "
         "body and wraps the response in { data: { job, estimatedPrice } }. "
-        "Creates the job, snapshots SLA, estimates pricing, and starts matching."
+        "Creates the job, snapshots SLA, estimates pricing, and starts matching "
+        "in the background once the response has been sent."
     ),
 )
 async def book_job(
     db: DBSession,
     user: CurrentUser,
     body: MobileJobCreateRequest,
-) -> dict[str, Any]:
+    background_tasks: BackgroundTasks,
+) -> Response:
     # Determine priority from emergency flag
     priority = "emergency" if body.is_emergency else "standard"
 
@@ -125,7 +246,7 @@ async def book_job(
         }
 
     try:
-        job = await jobService.create_job(
+        booking = await jobService.book_job(
             db,
             customer_id=user.id,
             task_id=body.service_task_id,
@@ -150,39 +271,9 @@ async def book_job(
             detail=str(exc),
         )
 
-    # Transition from DRAFT to PENDING_MATCH to kick off matching
-    try:
-        job = await jobService.update_job_status(
-            db,
-            job.id,
-            "pending_match",
-            actor_type="system",
-        )
-    except (jobService.JobNotFoundError, jobService.InvalidTransitionError):
-        pass  # Stay in DRAFT if transition fails
-
-    # Attempt price estimation
-    estimated_price = EstimatedPriceOut(
-        min_cents=job.quoted_price_cents or 0,
-        max_cents=job.quoted_price_cents or 0,
-        currency=job.currency,
-        is_emergency=job.is_emergency,
-        dynamic_multiplier=None,
-    )
-
-    # Try to calculate from the pricing engine
-    try:
-        from src.services.pricingEngine import calculate_price as calc_price
-
-        estimate = await calc_price(
-            db,
-            task_id=job.task_id,
-            latitude=job.service_latitude,
-            longitude=job.service_longitude,
-            requested_date=job.requested_date,
-            is_emergency=job.is_emergency,
-            country=job.service_country,
-        )
+    job = booking.job
+    estimate = booking.estimate
+    if estimate is not None:
         estimated_price = EstimatedPriceOut(
             min_cents=estimate.final_price_min_cents,
             max_cents=estimate.final_price_max_cents,
@@ -190,45 +281,29 @@ async def book_job(
             is_emergency=estimate.is_emergency,
             dynamic_multiplier=estimate.dynamic_multiplier,
         )
-
-        # Update the job with the quoted price
-        job.quoted_price_cents = estimate.final_price_min_cents
-        job.commission_rate = estimate.commission_rate_default
-        job.commission_amount_cents = int(
-            Decimal(str(estimate.final_price_min_cents))
-            * estimate.commission_rate_default
-        )
-        job.provider_payout_cents = (
-            estimate.final_price_min_cents - job.commission_amount_cents
+    else:
+        estimated_price = EstimatedPriceOut(
+            min_cents=job.quoted_price_cents or 0,
+            max_cents=job.quoted_price_cents or 0,
+            currency=job.currency,
+            is_emergency=job.is_emergency,
+            dynamic_multiplier=None,
         )
-        await db.flush()
-    except Exception as exc:
-        logger.warning("Price estimation failed for job %s: %s", job.id, exc)
 
-    # Start matching (best-effort for MVP)
-    try:
-        from src.services.matchingEngine import assign_provider, find_matching_providers
-
-        match_result = await find_matching_providers(db, job, max_results=1)
-        if match_result["matches"]:
-            best = match_result["matches"][0]
-            await assign_provider(
-                db,
-                job.id,
-                best["provider_id"],
-                match_score=float(best["composite_score"]),
-            )
-    except Exception as exc:
-        logger.warning("Auto-matching failed for job %s: %s", job.id, exc)
+    # Matching does not affect the response, so it runs after the response
+    # is sent on its own session.  Commit now so that session sees the job.
+    await db.commit()
+    background_tasks.add_task(_match_and_assign, job.id)
 
-    # Build mobile-friendly response
-    job_out = MobileJobOut.model_validate(job)
-    response = JobCreateResponse(
-        job=job_out,
+    # Build mobile-friendly response.  Both parts are already validated, so
+    # the wrapper is constructed without a second validation pass and the
+    # whole envelope is rendered to JSON bytes in one call.
+    response = JobCreateResponse.model_construct(
+        job=_job_to_mobile_out(job),
         estimated_price=estimated_price,
     )
 
-    return {"data": response.model_dump(by_alias=True)}
+    return data_response(response, status_code=status.HTTP_201_CREATED)
 
 
 # ---------------------------------------------------------------------------
@@ -237,55 +312,77 @@ async def book_job(
 
 @router.get(
     "/active",
+    response_class=JSONResponse,
     summary="Get customer's active jobs",
     description=(
-        "Returns active jobs for the authenticated customer. Active means "
-        "any status except completed, cancelled, disputed, and refunded."
+        "Returns a page of active jobs for the authenticated customer. Active "
+        "means any status except completed, cancelled, disputed, and refunded."
     ),
 )
 async def get_active_jobs(
     db: DBSession,
     user: CurrentUser,
-) -> dict[str, Any]:
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
-
-    from src.models.job import Job, JobStatus
-
-    terminal_statuses = {
-        JobStatus.COMPLETED,
-        JobStatus.CANCELLED_BY_CUSTOMER,
-        JobStatus.CANCELLED_BY_PROVIDER,
-        JobStatus.CANCELLED_BY_SYSTEM,
-        JobStatus.DISPUTED,
-        JobStatus.REFUNDED,
-    }
-
-    stmt = (
-        select(Job)
-        .options(selectinload(Job.assignments))
+    page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
+    page_size: int = Query(
+        default=_DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=_MAX_PAGE_SIZE,
+        alias="pageSize",
+        description="Number of items per page",
+    ),
+) -> Response:
+    # lambda_stmt caches the constructed statement and its cache key, so
+    # repeat calls only bind new parameter values.
+    customer_id = user.id
+    offset = (page - 1) * page_size
+
+    # The total rides along on every row via COUNT(*) OVER (), so a page
+    # and its meta cost one round trip.
+    stmt = lambda_stmt(
+        lambda: select(Job, func.count().over().label("total_items"))
+        .options(selectinload(Job.assignments), raiseload("*"))
         .where(
-            Job.customer_id == user.id,
-            Job.status.not_in(terminal_statuses),
+            Job.customer_id == customer_id,
+            Job.status.in_(_ACTIVE_STATUSES),
         )
         .order_by(Job.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    result = await db.stream(
+        stmt, execution_options={"yield_per": _ACTIVE_JOBS_YIELD_PER}
     )
-    result = await db.execute(stmt)
-    jobs = result.scalars().all()
+    rows = [row async for row in result]
+
+    if rows:
+        total_items: int = rows[0].total_items
+    elif page > 1:
+        # Past the last page there is no row to carry the window total.
+        count_stmt = lambda_stmt(
+            lambda: select(func.count(Job.id)).where(
+                Job.customer_id == customer_id,
+                Job.status.in_(_ACTIVE_STATUSES),
+            )
+        )
+        total_items = (await db.execute(count_stmt)).scalar_one()
+    else:
+        total_items = 0
 
-    items = [MobileJobOut.model_validate(j).model_dump(by_alias=True) for j in jobs]
+    items = _MOBILE_JOB_LIST.validate_python(
+        [row[0] for row in rows], from_attributes=True
+    )
 
-    return {
-        "data": {
+    return data_response(
+        {
             "items": items,
             "meta": {
-                "page": 1,
-                "pageSize": len(items),
-                "totalItems": len(items),
-                "totalPages": 1,
+                "page": page,
+                "pageSize": page_size,
+                "totalItems": total_items,
+                "totalPages": math.ceil(total_items / page_size),
             },
-        },
-    }
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -311,11 +408,15 @@ async def list_jobs_by_customer(
     ),
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(
-        default=settings.default_page_size,
+        default=_DEFAULT_PAGE_SIZE,
         ge=1,
-        le=settings.max_page_size,
+        le=_MAX_PAGE_SIZE,
         description="Number of items per page",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor; overrides page",
+    ),
 ) -> JobListResponse:
     try:
         result = await jobService.get_jobs_by_customer(
@@ -324,6 +425,7 @@ async def list_jobs_by_customer(
             status_filter=status_filter,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(
@@ -332,12 +434,13 @@ async def list_jobs_by_customer(
         )
 
     return JobListResponse(
-        data=[JobBrief.model_validate(job) for job in result.items],
-        meta=PaginationMeta(
+        data=_JOB_BRIEF_LIST.validate_python(result.items, from_attributes=True),
+        meta=CursorPaginationMeta(
             page=result.page,
             page_size=result.page_size,
             total_items=result.total_items,
             total_pages=result.total_pages,
+            next_cursor=result.next_cursor,
         ),
     )
 
@@ -365,11 +468,15 @@ async def list_jobs_by_provider(
     ),
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(
-        default=settings.default_page_size,
+        default=_DEFAULT_PAGE_SIZE,
         ge=1,
-        le=settings.max_page_size,
+        le=_MAX_PAGE_SIZE,
         description="Number of items per page",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor; overrides page",
+    ),
 ) -> JobListResponse:
     try:
         result = await jobService.get_jobs_by_provider(
@@ -378,6 +485,7 @@ async def list_jobs_by_provider(
             status_filter=status_filter,
             page=page,
             page_size=page_size,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(
@@ -386,12 +494,13 @@ async def list_jobs_by_provider(
         )
 
     return JobListResponse(
-        data=[JobBrief.model_validate(job) for job in result.items],
-        meta=PaginationMeta(
+        data=_JOB_BRIEF_LIST.validate_python(result.items, from_attributes=True),
+        meta=CursorPaginationMeta(
             page=result.page,
             page_size=result.page_size,
             total_items=result.total_items,
             total_pages=result.total_pages,
+            next_cursor=result.next_cursor,
         ),
     )
 
@@ -402,7 +511,7 @@ async def list_jobs_by_provider(
 
 @router.get(
     "/{job_id}",
-    response_model=JobOut,
+    response_class=JSONResponse,
     summary="Get job detail",
     description=(
         "Returns the full detail for a single job, including SLA snapshot, "
@@ -412,8 +521,8 @@ async def list_jobs_by_provider(
 async def get_job(
     db: DBSession,
     job_id: uuid.UUID,
-) -> JobOut:
-    job = await jobService.get_job(db, job_id)
+) -> Response:
+    job = await jobService.get_job(db, job_id, include_providers=True)
     if job is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -421,82 +530,45 @@ async def get_job(
         )
 
     # Build enriched response with assignment and provider info
-    job_data = JobOut.model_validate(job).model_dump()
+    job_out = JobOut.model_validate(job)
 
     # Attach assignment and provider info for the mobile app
     assignment_data = None
     provider_data = None
-    if job.assignments:
-        from src.models.job import AssignmentStatus
-
-        active_assignment = None
-        for a in job.assignments:
-            if a.status in (AssignmentStatus.OFFERED, AssignmentStatus.ACCEPTED):
-                active_assignment = a
-                break
-
-        if active_assignment:
-            assignment_data = {
-                "id": str(active_assignment.id),
-                "status": active_assignment.status.value,
-                "offeredAt": (
-                    active_assignment.offered_at.isoformat()
-                    if active_assignment.offered_at
-                    else None
-                ),
-                "respondedAt": (
-                    active_assignment.responded_at.isoformat()
-                    if active_assignment.responded_at
-                    else None
-                ),
-                "slaResponseDeadline": (
-                    active_assignment.sla_response_deadline.isoformat()
-                    if active_assignment.sla_response_deadline
-                    else None
-                ),
-                "slaArrivalDeadline": (
-                    active_assignment.sla_arrival_deadline.isoformat()
-                    if active_assignment.sla_arrival_deadline
-                    else None
+    active_assignment = next(
+        (a for a in job.assignments if a.status in _ACTIVE_ASSIGNMENT_STATUSES),
+        None,
+    )
+    if active_assignment is not None:
+        assignment_data = {
+            "id": str(active_assignment.id),
+            "status": active_assignment.status.value,
+            **{
+                key: getattr(active_assignment, attr)
+                for key, attr in _ASSIGNMENT_TIME_FIELDS
+            },
+            "estimatedArrivalMin": active_assignment.estimated_arrival_min,
+        }
+
+        provider = active_assignment.provider
+        if provider and provider.user:
+            provider_data = {
+                "id": str(provider.id),
+                "displayName": (
+                    provider.user.display_name
+                    or f"{provider.user.first_name} {provider.user.last_name}"
                 ),
-                "estimatedArrivalMin": active_assignment.estimated_arrival_min,
+                "level": provider.current_level.value,
+                "avatarUrl": provider.user.avatar_url,
             }
 
-            # Load provider info
-            try:
-                from sqlalchemy import select
-                from sqlalchemy.orm import selectinload
-
-                from src.models.provider import ProviderProfile
-
-                prov_stmt = (
-                    select(ProviderProfile)
-                    .options(selectinload(ProviderProfile.user))
-                    .where(ProviderProfile.id == active_assignment.provider_id)
-                )
-                prov_result = await db.execute(prov_stmt)
-                provider = prov_result.scalar_one_or_none()
-
-                if provider and provider.user:
-                    provider_data = {
-                        "id": str(provider.id),
-                        "displayName": (
-                            provider.user.display_name
-                            or f"{provider.user.first_name} {provider.user.last_name}"
-                        ),
-                        "level": provider.current_level.value,
-                        "avatarUrl": provider.user.avatar_url,
-                    }
-            except Exception:
-                pass
-
-    return {
-        "data": {
-            "job": job_data,
+    return data_response(
+        {
+            "job": job_out,
             "assignment": assignment_data,
             "provider": provider_data,
-        },
-    }
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -530,7 +602,10 @@ async def update_job_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc),
         )
-    except jobService.InvalidTransitionError as exc:
+    except (
+        jobService.InvalidTransitionError,
+        jobService.ConcurrentUpdateError,
+    ) as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
@@ -572,7 +647,10 @@ async def cancel_job(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc),
         )
-    except jobService.InvalidTransitionError as exc:
+    except (
+        jobService.InvalidTransitionError,
+        jobService.ConcurrentUpdateError,
+    ) as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
@@ -599,37 +677,25 @@ async def mobile_update_job_status(
     user: CurrentUser,
     job_id: uuid.UUID,
     body: MobileJobStatusUpdateRequest,
-) -> dict[str, Any]:
-    # Map mobile status values to internal status and actor type
-    status_map = {
-        "cancelled": "cancelled_by_customer",
-        "en_route": "provider_en_route",
-        "arrived": "in_progress",  # Map arrived to in_progress for now
-        "in_progress": "in_progress",
-        "completed": "completed",
-    }
-
-    internal_status = status_map.get(body.status)
+) -> Response:
+    # Determine actor type from user roles (admin outranks provider)
+    actor_type = (
+        "admin" if user.role_admin
+        else "provider" if user.role_provider
+        else "customer"
+    )
+
+    # Map mobile status values to internal status: actor-specific entries
+    # first, then the actor-independent default.
+    internal_status = _MOBILE_STATUS_MAP.get(
+        (body.status, actor_type)
+    ) or _MOBILE_STATUS_MAP.get((body.status, None))
     if internal_status is None:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Unknown status '{body.status}'.",
         )
 
-    # Determine actor type from user roles
-    actor_type = "customer"
-    if user.role_provider:
-        actor_type = "provider"
-    if user.role_admin:
-        actor_type = "admin"
-
-    # Special case: cancellation
-    if body.status == "cancelled":
-        if actor_type == "provider":
-            internal_status = "cancelled_by_provider"
-        elif actor_type in ("admin", "system"):
-            internal_status = "cancelled_by_system"
-
     try:
         job = await jobService.update_job_status(
             db,
@@ -643,14 +709,16 @@ async def mobile_update_job_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(exc),
         )
-    except jobService.InvalidTransitionError as exc:
+    except (
+        jobService.InvalidTransitionError,
+        jobService.ConcurrentUpdateError,
+    ) as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(exc),
         )
 
-    job_out = MobileJobOut.model_validate(job)
-    return {"data": {"job": job_out.model_dump(by_alias=True)}}
+    return data_response({"job": _job_to_mobile_out(job)})
 
 
 # ---------------------------------------------------------------------------
@@ -659,6 +727,7 @@ async def mobile_update_job_status(
 
 @router.get(
     "/{job_id}/tracking",
+    response_class=JSONResponse,
     summary="Get real-time job tracking info",
     description=(
         "Returns provider location, ETA, and current status for tracking "
@@ -667,10 +736,27 @@ async def mobile_update_job_status(
 )
 async def get_job_tracking(
     db: DBSession,
+    request: Request,
     job_id: uuid.UUID,
-) -> dict[str, Any]:
-    from src.services import providerService
+) -> Response:
+    # Polling clients send back the ETag they hold; an unchanged payload is
+    # answered with a bodiless 304.
+    cache_key = f"{_TRACKING_CACHE_PREFIX}{job_id}"
+    try:
+        redis = await get_redis()
+        cached = await redis.get(cache_key)
+    except Exception as exc:
+        logger.warning("Tracking cache read failed for job %s: %s", job_id, exc)
+        redis = cached = None
+    if cached is not None:
+        return conditional_json_response(request, cached.encode())
 
     tracking = await providerService.get_job_tracking(db, job_id)
-    result = JobTrackingOut(**tracking)
-    return {"data": result.model_dump(by_alias=True)}
+    body = render_data(JobTrackingOut(**tracking))
+
+    if redis is not None:
+        try:
+            await redis.set(cache_key, body, ex=_TRACKING_CACHE_TTL_SECONDS)
+        except Exception as exc:
+            logger.warning("Tracking cache write failed for job %s: %s", job_id, exc)
+    return conditional_json_response(request, body)
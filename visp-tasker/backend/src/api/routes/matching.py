@@ -15,6 +15,7 @@ from __future__ import annotations
 import uuid
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
 
 from src.api.deps import DBSession
 from src.api.schemas.matching import (
@@ -48,7 +49,7 @@ router = APIRouter(prefix="/matching", tags=["Matching"])
 async def find_matching_providers(
     db: DBSession,
     body: FindMatchRequest,
-) -> FindMatchResponse:
+) -> Response:
     # Load the job
     job = await jobService.get_job(db, body.job_id)
     if job is None:
@@ -70,13 +71,20 @@ async def find_matching_providers(
             detail=str(exc),
         )
 
-    return FindMatchResponse(
+    # The engine already emits the schema's field types, so the response is
+    # built with model_construct and rendered directly; returning a Response
+    # also skips FastAPI's re-validation against response_model, which is
+    # kept for the OpenAPI schema only.
+    response = FindMatchResponse.model_construct(
         job_id=result["job_id"],
         job_reference=result["job_reference"],
         job_level=result["job_level"],
         total_candidates_evaluated=result["total_candidates_evaluated"],
         total_qualified=result["total_qualified"],
-        matches=[MatchResult(**m) for m in result["matches"]],
+        matches=[MatchResult.model_construct(**m) for m in result["matches"]],
+    )
+    return Response(
+        content=response.model_dump_json(), media_type="application/json"
     )
 
 
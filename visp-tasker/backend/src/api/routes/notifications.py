@@ -19,13 +19,14 @@ from __future__ import annotations
 import logging
 import math
 import uuid
-from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import delete, func, select, update
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response
+from sqlalchemy import and_, bindparam, delete, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.api.deps import DBSession
+from src.api.responses import conditional_json_response, not_modified, version_etag
 from src.api.schemas.notification import (
     DeviceRegisterRequest,
     DeviceRegisterResponse,
@@ -39,16 +40,101 @@ from src.api.schemas.notification import (
     UnreadCountResponse,
 )
 from src.core.config import settings
+from src.core.pagination import decode_cursor, encode_cursor
 from src.models.notification import (
     DeviceToken,
     Notification,
     NotificationPreference,
 )
+from src.services import notificationService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
+# Preference values for a user who has never configured them: everything on
+# except marketing.  Mirrors the server defaults on NotificationPreference.
+_DEFAULT_PREFERENCES: dict[str, bool] = {
+    "job_updates": True,
+    "payment_updates": True,
+    "marketing": False,
+    "sla_warnings": True,
+    "emergency_alerts": True,
+}
+
+# Preferences and the unread count are fetched on nearly every screen.  A
+# two-second private cache lets the app's HTTP cache (and any per-user
+# proxy micro-cache) absorb those bursts; Vary keeps one user's copy from
+# ever serving another.
+_MICROCACHE_HEADERS: dict[str, str] = {
+    "Cache-Control": "private, max-age=2",
+    "Vary": "Authorization",
+}
+
+# Polled and per-request statements built once with bind parameters, so
+# each call reuses the statement object and its memoized compiled-cache key
+# instead of rebuilding and re-keying the expression tree.
+
+# Version probe for history ETags: the user's latest change and row count.
+_HISTORY_VERSION_STMT = select(
+    func.max(Notification.updated_at), func.count()
+).where(Notification.user_id == bindparam("user_id"))
+
+# Marks one notification read in a single round trip.  The "old" CTE locks
+# the row and captures its owner and pre-update read flag, so no row back
+# means 404 and was_read tells "already read" from a fresh mark.  The
+# UPDATE only touches a row that is still unread: the updated_at trigger
+# fires on every UPDATE, so re-marking a read row would otherwise bump
+# updated_at and invalidate every history ETag for nothing.  Postgres runs
+# a data-modifying CTE even though the outer SELECT does not read it.
+_MARK_READ_OLD = (
+    select(
+        Notification.id,
+        Notification.user_id,
+        Notification.read.label("was_read"),
+    )
+    .where(Notification.id == bindparam("notification_id"))
+    .with_for_update()
+    .cte("old")
+)
+_MARK_READ_UPDATE = (
+    update(Notification)
+    .where(Notification.id == _MARK_READ_OLD.c.id, Notification.read.is_(False))
+    .values(read=True, read_at=func.now())
+    .returning(Notification.id)
+    .cte("marked")
+)
+_MARK_READ_STMT = select(
+    _MARK_READ_OLD.c.user_id, _MARK_READ_OLD.c.was_read
+).add_cte(_MARK_READ_UPDATE)
+
+# History rows are read as plain column tuples and handed to
+# NotificationOut.model_construct: the values come straight from typed
+# columns, so per-field validation of every row would only repeat what the
+# database already guarantees.  Selecting columns also means no ORM
+# identity-map bookkeeping or lazy relationship loads per row.
+_HISTORY_COLUMNS = (
+    Notification.id,
+    Notification.user_id,
+    Notification.title,
+    Notification.body,
+    Notification.notification_type,
+    Notification.data_json,
+    Notification.read,
+    Notification.read_at,
+    Notification.sent_at,
+    Notification.created_at,
+)
+
+_PREFERENCES_BY_USER_STMT = select(NotificationPreference).where(
+    NotificationPreference.user_id == bindparam("user_id")
+)
+
+# The same row as plain columns, shaped like the upsert's RETURNING.
+_PREFERENCE_ROW_BY_USER_STMT = select(NotificationPreference.__table__.c).where(
+    NotificationPreference.user_id == bindparam("user_id")
+)
+
 
 # ---------------------------------------------------------------------------
 # POST /api/v1/notifications/register-device
@@ -85,7 +171,7 @@ async def register_device(
                 "platform": body.platform,
                 "app_version": body.app_version,
                 "is_active": True,
-                "updated_at": datetime.now(timezone.utc),
+                "updated_at": func.now(),
             },
         )
         .returning(DeviceToken.__table__.c)
@@ -93,7 +179,6 @@ async def register_device(
 
     result = await db.execute(stmt)
     row = result.one()
-    await db.flush()
 
     logger.info(
         "Device token registered: user=%s, platform=%s",
@@ -135,7 +220,7 @@ async def unregister_device(
             DeviceToken.user_id == body.user_id,
             DeviceToken.device_token == body.device_token,
         )
-        .values(is_active=False, updated_at=datetime.now(timezone.utc))
+        .values(is_active=False, updated_at=func.now())
     )
 
     if result.rowcount == 0:
@@ -144,8 +229,6 @@ async def unregister_device(
             detail="Device token not found for this user.",
         )
 
-    await db.flush()
-
     logger.info(
         "Device token unregistered: user=%s", body.user_id
     )
@@ -161,11 +244,16 @@ async def unregister_device(
     summary="Get notification history",
     description=(
         "Returns a paginated list of notifications for a user, ordered by "
-        "most recent first. Includes both read and unread notifications."
+        "most recent first. Includes both read and unread notifications. "
+        "Pass the previous page's next_cursor as cursor to page by keyset "
+        "instead of page number; with a cursor the totals in meta count only "
+        "the notifications from the cursor onwards. Responses carry an ETag; "
+        "send it back in If-None-Match to get a 304 when nothing has changed."
     ),
 )
 async def get_notification_history(
     db: DBSession,
+    request: Request,
     user_id: uuid.UUID,
     page: int = Query(default=1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(
@@ -183,7 +271,23 @@ async def get_notification_history(
         default=False,
         description="Only return unread notifications",
     ),
-) -> NotificationHistoryResponse:
+    cursor: str | None = Query(
+        default=None,
+        description="Keyset cursor from a previous page's next_cursor; overrides page",
+    ),
+) -> Response:
+    # Any insert, read-mark or delete moves the user's latest updated_at or
+    # row count, so together with the query string they version every page.
+    # A client polling an unchanged page gets a 304 from this one probe
+    # without the page query running.
+    latest_update, notification_count = (
+        await db.execute(_HISTORY_VERSION_STMT, {"user_id": user_id})
+    ).one()
+    etag = version_etag(latest_update, notification_count, request.url.query)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+
     # Build base query
     base_filter = [Notification.user_id == user_id]
 
@@ -192,33 +296,74 @@ async def get_notification_history(
     if unread_only:
         base_filter.append(Notification.read.is_(False))
 
-    # Count total
-    count_stmt = select(func.count()).select_from(Notification).where(*base_filter)
-    total_items = (await db.execute(count_stmt)).scalar_one()
-
-    total_pages = math.ceil(total_items / page_size) if total_items > 0 else 0
-
-    # Fetch page
-    offset = (page - 1) * page_size
+    # Fetch the page and the total in one pass: COUNT(*) OVER () is evaluated
+    # over the filtered set before LIMIT/OFFSET, so every row carries the
+    # full match count.  With a cursor the page is located by keyset on
+    # (created_at, id), so deep pages cost the same as the first one; the
+    # total then counts the notifications from the cursor onwards.
     data_stmt = (
-        select(Notification)
+        select(*_HISTORY_COLUMNS, func.count().over().label("total_items"))
         .where(*base_filter)
-        .order_by(Notification.created_at.desc())
-        .offset(offset)
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
         .limit(page_size)
     )
-    result = await db.execute(data_stmt)
-    notifications = result.scalars().all()
+    if cursor is not None:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(exc),
+            )
+        data_stmt = data_stmt.where(
+            or_(
+                Notification.created_at < cursor_created_at,
+                and_(
+                    Notification.created_at == cursor_created_at,
+                    Notification.id < cursor_id,
+                ),
+            )
+        )
+        offset = 0
+    else:
+        offset = (page - 1) * page_size
+        data_stmt = data_stmt.offset(offset)
+    rows = (await db.execute(data_stmt)).all()
+
+    if rows:
+        total_items = rows[0].total_items
+    elif offset:
+        # Past the last page there are no rows to carry the window count.
+        count_stmt = select(func.count()).select_from(Notification).where(*base_filter)
+        total_items = (await db.execute(count_stmt)).scalar_one()
+    else:
+        total_items = 0
 
-    return NotificationHistoryResponse(
-        data=[NotificationOut.model_validate(n) for n in notifications],
+    next_cursor = None
+    if rows and offset + len(rows) < total_items:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    total_pages = math.ceil(total_items / page_size) if total_items > 0 else 0
+
+    response = NotificationHistoryResponse(
+        data=[
+            NotificationOut.model_construct(
+                **{**row._mapping, "notification_type": row.notification_type.value}
+            )
+            for row in rows
+        ],
         meta=PaginationMeta(
             page=page,
             page_size=page_size,
             total_items=total_items,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
+    return conditional_json_response(
+        request, response.model_dump_json().encode(), etag=etag
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -235,32 +380,22 @@ async def mark_notification_read(
     db: DBSession,
     notification_id: uuid.UUID,
 ) -> NotificationReadResponse:
-    now = datetime.now(timezone.utc)
-
     result = await db.execute(
-        update(Notification)
-        .where(
-            Notification.id == notification_id,
-            Notification.read.is_(False),
-        )
-        .values(read=True, read_at=now, updated_at=now)
+        _MARK_READ_STMT, {"notification_id": notification_id}
     )
-    await db.flush()
+    row = result.one_or_none()
 
-    if result.rowcount == 0:
-        # Check if it exists at all
-        exists_result = await db.execute(
-            select(Notification.id).where(Notification.id == notification_id)
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Notification with id '{notification_id}' not found.",
         )
-        if exists_result.scalar_one_or_none() is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Notification with id '{notification_id}' not found.",
-            )
-        # Already read
+    if row.was_read:
         return NotificationReadResponse(success=True, updated_count=0)
 
-    return NotificationReadResponse(success=True, updated_count=result.rowcount)
+    notificationService.unread_count_changed_on_commit(db, row.user_id, delta=-1)
+
+    return NotificationReadResponse(success=True, updated_count=1)
 
 
 # ---------------------------------------------------------------------------
@@ -277,17 +412,25 @@ async def mark_all_notifications_read(
     db: DBSession,
     user_id: uuid.UUID,
 ) -> NotificationReadResponse:
-    now = datetime.now(timezone.utc)
-
+    # Always run the UPDATE: a cached count may be stale, and trusting a
+    # stale zero would drop the write.  With nothing unread it is only a
+    # probe of the unread partial index.
     result = await db.execute(
         update(Notification)
         .where(
             Notification.user_id == user_id,
             Notification.read.is_(False),
         )
-        .values(read=True, read_at=now, updated_at=now)
+        .values(read=True, read_at=func.now(), updated_at=func.now())
     )
-    await db.flush()
+
+    # Push the rows actually marked as a delta rather than an absolute
+    # zero: a notification stored concurrently is still unread.  The delta
+    # also drops the cached count, so the next unread-count poll recounts.
+    if result.rowcount:
+        notificationService.unread_count_changed_on_commit(
+            db, user_id, delta=-result.rowcount
+        )
 
     logger.info(
         "Marked %d notifications as read for user %s",
@@ -306,21 +449,19 @@ async def mark_all_notifications_read(
     "/unread-count/{user_id}",
     response_model=UnreadCountResponse,
     summary="Get unread notification count",
-    description="Returns the number of unread notifications for a user.",
+    description=(
+        "Returns the number of unread notifications for a user, for initial "
+        "sync; later changes are pushed over Socket.IO as "
+        "notification:unread_count. Served from a short-lived cache that is "
+        "dropped on every new or read notification."
+    ),
 )
 async def get_unread_count(
-    db: DBSession,
+    response: Response,
     user_id: uuid.UUID,
 ) -> UnreadCountResponse:
-    result = await db.execute(
-        select(func.count())
-        .select_from(Notification)
-        .where(
-            Notification.user_id == user_id,
-            Notification.read.is_(False),
-        )
-    )
-    count = result.scalar_one()
+    count = await notificationService.get_unread_count(user_id)
+    response.headers.update(_MICROCACHE_HEADERS)
 
     return UnreadCountResponse(user_id=user_id, unread_count=count)
 
@@ -341,57 +482,49 @@ async def get_unread_count(
 )
 async def update_notification_preferences(
     db: DBSession,
+    response: Response,
     user_id: uuid.UUID,
     body: NotificationPreferencesRequest,
 ) -> NotificationPreferencesOut:
-    # Check if preferences exist
-    result = await db.execute(
-        select(NotificationPreference).where(
-            NotificationPreference.user_id == user_id
-        )
+    # Single-statement upsert keyed on the unique user_id: a first write
+    # inserts defaults overlaid with the provided fields, later writes only
+    # touch the fields present in the body.  This replaces the SELECT then
+    # INSERT/UPDATE sequence, which cost an extra round trip and could race
+    # two concurrent first writes into a unique-violation.
+    provided = body.model_dump(exclude_none=True)
+    insert_stmt = pg_insert(NotificationPreference).values(
+        user_id=user_id, **{**_DEFAULT_PREFERENCES, **provided}
     )
-    prefs = result.scalar_one_or_none()
-
-    if prefs is None:
-        # Create with defaults, then apply any provided overrides
-        prefs = NotificationPreference(
-            user_id=user_id,
-            job_updates=body.job_updates if body.job_updates is not None else True,
-            payment_updates=body.payment_updates if body.payment_updates is not None else True,
-            marketing=body.marketing if body.marketing is not None else False,
-            sla_warnings=body.sla_warnings if body.sla_warnings is not None else True,
-            emergency_alerts=body.emergency_alerts if body.emergency_alerts is not None else True,
+    if provided:
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={**provided, "updated_at": func.now()},
         )
-        db.add(prefs)
-        await db.flush()
-        await db.refresh(prefs)
+        row = (
+            await db.execute(stmt.returning(NotificationPreference.__table__.c))
+        ).one()
     else:
-        # Update only provided fields
-        update_fields: dict = {}
-        if body.job_updates is not None:
-            update_fields["job_updates"] = body.job_updates
-        if body.payment_updates is not None:
-            update_fields["payment_updates"] = body.payment_updates
-        if body.marketing is not None:
-            update_fields["marketing"] = body.marketing
-        if body.sla_warnings is not None:
-            update_fields["sla_warnings"] = body.sla_warnings
-        if body.emergency_alerts is not None:
-            update_fields["emergency_alerts"] = body.emergency_alerts
-
-        if update_fields:
-            update_fields["updated_at"] = datetime.now(timezone.utc)
-            await db.execute(
-                update(NotificationPreference)
-                .where(NotificationPreference.user_id == user_id)
-                .values(**update_fields)
-            )
-            await db.flush()
-            await db.refresh(prefs)
+        # Nothing to change.  Any UPDATE -- even a self-assignment in ON
+        # CONFLICT DO UPDATE -- fires the updated_at trigger and would change
+        # the ETag, so an existing row is left alone and read back instead.
+        stmt = insert_stmt.on_conflict_do_nothing(index_elements=["user_id"])
+        row = (
+            await db.execute(stmt.returning(NotificationPreference.__table__.c))
+        ).one_or_none()
+        if row is None:
+            row = (
+                await db.execute(_PREFERENCE_ROW_BY_USER_STMT, {"user_id": user_id})
+            ).one()
 
     logger.info("Notification preferences updated for user %s", user_id)
 
-    return NotificationPreferencesOut.model_validate(prefs)
+    # The new version's ETag tells a client holding a micro-cached GET that
+    # its copy is stale.
+    response.headers["ETag"] = version_etag(user_id, row.updated_at)
+
+    # RETURNING yields exactly the schema's columns, so the row mapping
+    # feeds the model directly without attribute lookups.
+    return NotificationPreferencesOut(**row._mapping)
 
 
 # ---------------------------------------------------------------------------
@@ -405,36 +538,30 @@ async def update_notification_preferences(
     description=(
         "Returns the current notification preferences for a user. If the "
         "user has not configured preferences, returns defaults (all enabled "
-        "except marketing)."
+        "except marketing) without saving them; id and timestamps are null. "
+        "Responses carry an ETag for If-None-Match revalidation."
     ),
 )
 async def get_notification_preferences(
     db: DBSession,
+    request: Request,
     user_id: uuid.UUID,
-) -> NotificationPreferencesOut:
-    result = await db.execute(
-        select(NotificationPreference).where(
-            NotificationPreference.user_id == user_id
-        )
-    )
+) -> Response:
+    result = await db.execute(_PREFERENCES_BY_USER_STMT, {"user_id": user_id})
     prefs = result.scalar_one_or_none()
 
     if prefs is None:
-        # Create default preferences
-        prefs = NotificationPreference(
-            user_id=user_id,
-            job_updates=True,
-            payment_updates=True,
-            marketing=False,
-            sla_warnings=True,
-            emergency_alerts=True,
-        )
-        db.add(prefs)
-        await db.flush()
-        await db.refresh(prefs)
-
-        logger.info(
-            "Created default notification preferences for user %s", user_id
-        )
+        # Report the defaults without persisting them; the row is created
+        # on the first POST to /preferences/{user_id}.
+        out = NotificationPreferencesOut(user_id=user_id, **_DEFAULT_PREFERENCES)
+    else:
+        out = NotificationPreferencesOut.model_validate(prefs)
 
-    return NotificationPreferencesOut.model_validate(prefs)
+    # The single row's updated_at versions it; the defaults never change.
+    response = conditional_json_response(
+        request,
+        out.model_dump_json().encode(),
+        etag=version_etag(user_id, out.updated_at),
+    )
+    response.headers.update(_MICROCACHE_HEADERS)
+    return response
@@ -18,6 +18,7 @@ Stripe Connect (Provider):
   POST /payments/connect/create          -- Create connected account
   POST /payments/connect/onboard-link    -- Generate onboarding link
   GET  /payments/connect/status/{id}     -- Check account status
+  GET  /payments/connect/dashboard/{id}  -- Status, balance and payouts
 
 Provider Balance & Payouts:
   GET  /payments/balance/{account_id}    -- Get provider balance
@@ -29,10 +30,14 @@ Webhook:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
 
+from src.api.responses import conditional_json_response
 from src.api.schemas.payment import (
     AccountLinkOut,
     AccountStatusOut,
@@ -50,6 +55,7 @@ from src.api.schemas.payment import (
     PaymentMethodOut,
     PayoutInfoOut,
     PayoutListOut,
+    ProviderDashboardOut,
     RefundOut,
     RefundRequest,
     WebhookResultOut,
@@ -66,13 +72,18 @@ from src.integrations.stripe.paymentService import (
     refund_payment,
 )
 from src.integrations.stripe.payoutService import (
+    PayoutInfo,
     check_account_status,
     create_account_link,
     create_connected_account,
     get_balance,
     list_payouts,
 )
-from src.integrations.stripe.webhookHandler import handle_webhook
+from src.integrations.stripe.webhookHandler import (
+    claim_event,
+    process_event,
+    verify_webhook,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -80,11 +91,15 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
 # ---------------------------------------------------------------------------
-# Helper: convert PaymentError to HTTPException
+# Exception handler: PaymentError -> 402
 # ---------------------------------------------------------------------------
 
-def _payment_error_to_http(exc: PaymentError) -> HTTPException:
-    """Map a PaymentError to an appropriate HTTP error response."""
+async def payment_error_handler(request: Request, exc: PaymentError) -> JSONResponse:
+    """Map a PaymentError raised by any route to a 402 response.
+
+    Registered on the app in ``src.main``; the body keeps the
+    ``{"detail": {...}}`` shape clients already parse.
+    """
     detail = {
         "message": exc.message,
         "stripe_error_code": exc.stripe_error_code,
@@ -94,12 +109,29 @@ def _payment_error_to_http(exc: PaymentError) -> HTTPException:
     if exc.decline_code:
         detail["decline_code"] = exc.decline_code
 
-    return HTTPException(
+    return JSONResponse(
         status_code=status.HTTP_402_PAYMENT_REQUIRED,
-        detail=detail,
+        content={"detail": detail},
+    )
+
+
+def _payout_info_out(payout: PayoutInfo) -> PayoutInfoOut:
+    """Build a payout DTO without validation; the SDK boundary already typed it."""
+    return PayoutInfoOut.model_construct(
+        id=payout.id,
+        status=payout.status,
+        amount_cents=payout.amount_cents,
+        currency=payout.currency,
+        arrival_date=payout.arrival_date,
+        created_at=payout.created_at,
     )
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Render a constructed DTO directly, skipping response_model re-validation."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 # ---------------------------------------------------------------------------
 # POST /payments/create-intent
 # ---------------------------------------------------------------------------
@@ -130,8 +162,6 @@ async def create_payment_intent_endpoint(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(exc),
         ) from exc
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
 
     return PaymentIntentOut(
         id=result.id,
@@ -159,10 +189,7 @@ async def create_payment_intent_endpoint(
 async def confirm_payment_endpoint(
     payment_intent_id: str,
 ) -> PaymentConfirmationOut:
-    try:
-        result = await confirm_payment(payment_intent_id)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    result = await confirm_payment(payment_intent_id)
 
     return PaymentConfirmationOut(
         id=result.id,
@@ -192,10 +219,7 @@ async def cancel_payment_endpoint(
 ) -> CancelPaymentOut:
     reason = body.reason if body else "requested_by_customer"
 
-    try:
-        cancelled = await cancel_payment(payment_intent_id, reason=reason)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    cancelled = await cancel_payment(payment_intent_id, reason=reason)
 
     return CancelPaymentOut(
         cancelled=cancelled,
@@ -235,8 +259,6 @@ async def refund_payment_endpoint(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(exc),
         ) from exc
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
 
     return RefundOut(
         id=result.id,
@@ -257,14 +279,14 @@ async def refund_payment_endpoint(
 )
 async def list_payment_methods_endpoint(
     customer_id: str,
-) -> PaymentMethodListOut:
-    try:
-        methods = await list_payment_methods(customer_id)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+) -> Response:
+    methods = await list_payment_methods(customer_id)
 
+    # Stripe data is typed at the SDK boundary, so the DTOs are built with
+    # model_construct and rendered directly; response_model is kept for the
+    # OpenAPI schema only.
     methods_out = [
-        PaymentMethodOut(
+        PaymentMethodOut.model_construct(
             id=m.id,
             type=m.type,
             last4=m.last4,
@@ -275,10 +297,10 @@ async def list_payment_methods_endpoint(
         for m in methods
     ]
 
-    return PaymentMethodListOut(
+    return _json_response(PaymentMethodListOut.model_construct(
         methods=methods_out,
         count=len(methods_out),
-    )
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -297,13 +319,10 @@ async def list_payment_methods_endpoint(
 async def attach_payment_method_endpoint(
     body: AttachPaymentMethodRequest,
 ) -> dict:
-    try:
-        success = await attach_payment_method(
-            customer_id=body.customer_id,
-            payment_method_id=body.payment_method_id,
-        )
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    success = await attach_payment_method(
+        customer_id=body.customer_id,
+        payment_method_id=body.payment_method_id,
+    )
 
     return {
         "attached": success,
@@ -321,14 +340,15 @@ async def attach_payment_method_endpoint(
     response_model=WebhookResultOut,
     summary="Stripe webhook endpoint",
     description=(
-        "Receives and processes Stripe webhook events. Verifies the webhook "
-        "signature and processes events idempotently. This endpoint must "
-        "receive the raw request body (not JSON-parsed) for signature "
-        "verification."
+        "Receives Stripe webhook events. Verifies the webhook signature and "
+        "acknowledges immediately; the event is then processed idempotently "
+        "in the background. This endpoint must receive the raw request body "
+        "(not JSON-parsed) for signature verification."
     ),
 )
 async def stripe_webhook_endpoint(
     request: Request,
+    background_tasks: BackgroundTasks,
 ) -> WebhookResultOut:
     # Read raw body for signature verification
     payload = await request.body()
@@ -341,17 +361,31 @@ async def stripe_webhook_endpoint(
         )
 
     try:
-        result = await handle_webhook(payload=payload, sig_header=sig_header)
+        event = verify_webhook(payload=payload, sig_header=sig_header)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
 
+    # Redeliveries of an event already claimed by this or another instance
+    # are acknowledged without queueing any work.
+    if not await claim_event(event.id):
+        return WebhookResultOut(
+            event_type=event.type,
+            processed=False,
+            message=f"Event {event.id} already received (duplicate)",
+        )
+
+    # Stripe only needs to know the delivery was received.  Processing runs
+    # after the response is sent, so slow handlers never hold the
+    # acknowledgement open and trigger redeliveries.
+    background_tasks.add_task(process_event, event)
+
     return WebhookResultOut(
-        event_type=result.event_type,
-        processed=result.processed,
-        message=result.message,
+        event_type=event.type,
+        processed=False,
+        message=f"Event {event.id} queued for processing",
     )
 
 
@@ -373,14 +407,11 @@ async def stripe_webhook_endpoint(
 async def create_connected_account_endpoint(
     body: CreateConnectedAccountRequest,
 ) -> ConnectedAccountOut:
-    try:
-        result = await create_connected_account(
-            provider_id=body.provider_id,
-            email=body.email,
-            country=body.country,
-        )
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    result = await create_connected_account(
+        provider_id=body.provider_id,
+        email=body.email,
+        country=body.country,
+    )
 
     return ConnectedAccountOut(
         account_id=result.account_id,
@@ -406,14 +437,11 @@ async def create_connected_account_endpoint(
 async def create_onboard_link_endpoint(
     body: CreateAccountLinkRequest,
 ) -> AccountLinkOut:
-    try:
-        url = await create_account_link(
-            account_id=body.account_id,
-            refresh_url=body.refresh_url,
-            return_url=body.return_url,
-        )
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    url = await create_account_link(
+        account_id=body.account_id,
+        refresh_url=body.refresh_url,
+        return_url=body.return_url,
+    )
 
     return AccountLinkOut(
         url=url,
@@ -437,18 +465,62 @@ async def create_onboard_link_endpoint(
 )
 async def get_account_status_endpoint(
     account_id: str,
-) -> AccountStatusOut:
-    try:
-        account_status = await check_account_status(account_id)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    request: Request,
+) -> Response:
+    account_status = await check_account_status(account_id)
 
-    return AccountStatusOut(
+    # Onboarding screens poll this; the ETag over the rendered status lets
+    # an unchanged account answer with a bodiless 304.
+    status_out = AccountStatusOut.model_construct(
         account_id=account_status.account_id,
         charges_enabled=account_status.charges_enabled,
         payouts_enabled=account_status.payouts_enabled,
         requirements_due=account_status.requirements_due,
     )
+    return conditional_json_response(
+        request, status_out.model_dump_json().encode()
+    )
+
+
+# ---------------------------------------------------------------------------
+# GET /payments/connect/dashboard/{account_id}
+# ---------------------------------------------------------------------------
+
+@router.get(
+    "/connect/dashboard/{account_id}",
+    response_model=ProviderDashboardOut,
+    summary="Get provider payout dashboard",
+    description=(
+        "Returns the Connect account status, balance and the 10 most recent "
+        "payouts in one response. The three Stripe calls run concurrently."
+    ),
+)
+async def get_provider_dashboard_endpoint(
+    account_id: str,
+) -> Response:
+    account_status, balance, payouts = await asyncio.gather(
+        check_account_status(account_id),
+        get_balance(account_id),
+        list_payouts(account_id, limit=10),
+    )
+
+    return _json_response(ProviderDashboardOut.model_construct(
+        account_status=AccountStatusOut.model_construct(
+            account_id=account_status.account_id,
+            charges_enabled=account_status.charges_enabled,
+            payouts_enabled=account_status.payouts_enabled,
+            requirements_due=account_status.requirements_due,
+        ),
+        balance=BalanceOut.model_construct(
+            available_cents=balance.available_cents,
+            pending_cents=balance.pending_cents,
+            currency=balance.currency,
+        ),
+        payouts=PayoutListOut.model_construct(
+            payouts=[_payout_info_out(p) for p in payouts],
+            count=len(payouts),
+        ),
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -467,10 +539,7 @@ async def get_account_status_endpoint(
 async def get_balance_endpoint(
     account_id: str,
 ) -> BalanceOut:
-    try:
-        balance = await get_balance(account_id)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
+    balance = await get_balance(account_id)
 
     return BalanceOut(
         available_cents=balance.available_cents,
@@ -500,25 +569,12 @@ async def list_payouts_endpoint(
         le=100,
         description="Maximum number of payouts to return",
     ),
-) -> PayoutListOut:
-    try:
-        payouts = await list_payouts(account_id, limit=limit)
-    except PaymentError as exc:
-        raise _payment_error_to_http(exc) from exc
-
-    payouts_out = [
-        PayoutInfoOut(
-            id=p.id,
-            status=p.status,
-            amount_cents=p.amount_cents,
-            currency=p.currency,
-            arrival_date=p.arrival_date,
-            created_at=p.created_at,
-        )
-        for p in payouts
-    ]
+) -> Response:
+    payouts = await list_payouts(account_id, limit=limit)
 
-    return PayoutListOut(
+    payouts_out = [_payout_info_out(p) for p in payouts]
+
+    return _json_response(PayoutListOut.model_construct(
         payouts=payouts_out,
         count=len(payouts_out),
-    )
+    ))
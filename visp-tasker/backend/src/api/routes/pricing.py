@@ -6,6 +6,16 @@ Endpoints for price estimation and job price breakdowns.
 
   GET  /api/v1/pricing/estimate             -- Generate price estimate
   GET  /api/v1/pricing/breakdown/{job_id}   -- Get price breakdown for a job
+
+Non-emergency estimates are cached in Redis for 60 seconds, keyed on the
+location quantized to 0.001 degrees (roughly 100 m), so a client dragging
+a map pin does not re-run the pricing engine on every pan.  Emergency
+estimates depend on live weather and are never cached.  Responses carry
+``X-Cache: HIT`` or ``X-Cache: MISS``.
+
+Breakdowns carry an ETag built from the job's ``updated_at`` and its latest
+pricing event, checked with one small query before the breakdown is built;
+a matching ``If-None-Match`` gets a bodiless 304.
 """
 
 from __future__ import annotations
@@ -16,24 +26,54 @@ from datetime import date, time
 from decimal import Decimal
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response
 
 from src.api.deps import DBSession
+from src.api.responses import conditional_json_response, not_modified, version_etag
 from src.api.schemas.pricing import (
     MultiplierDetailOut,
     PriceBreakdownOut,
     PriceBreakdownRuleOut,
     PriceEstimateOut,
 )
+from src.realtime.socketServer import get_redis
 from src.services.pricingEngine import (
     calculate_price,
     get_price_breakdown,
+    get_price_breakdown_version,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/pricing", tags=["Pricing"])
 
+_ESTIMATE_CACHE_PREFIX: str = "visp:pricing:estimate:"
+_ESTIMATE_CACHE_TTL_SECONDS: int = 60
+_ESTIMATE_COORD_QUANTUM = Decimal("0.001")
+
+# A completed job's breakdown can still change through a dispute or refund,
+# so clients always revalidate; the ETag makes that a cheap 304.
+_BREAKDOWN_CACHE_CONTROL: str = "private, no-cache"
+
+
+def _estimate_cache_key(
+    task_id: uuid.UUID,
+    latitude: Decimal,
+    longitude: Decimal,
+    requested_date: Optional[date],
+    requested_time: Optional[time],
+    country: str,
+) -> str:
+    return ":".join((
+        f"{_ESTIMATE_CACHE_PREFIX}{task_id}",
+        str(latitude.quantize(_ESTIMATE_COORD_QUANTUM)),
+        str(longitude.quantize(_ESTIMATE_COORD_QUANTUM)),
+        requested_date.isoformat() if requested_date else "",
+        requested_time.isoformat() if requested_time else "",
+        country.upper(),
+    ))
+
 
 # ---------------------------------------------------------------------------
 # GET /api/v1/pricing/estimate
@@ -74,7 +114,24 @@ async def get_price_estimate(
         max_length=2,
         description="ISO 3166-1 alpha-2 country code",
     ),
-) -> PriceEstimateOut:
+) -> Response:
+    cache_key: Optional[str] = None
+    if not is_emergency:
+        cache_key = _estimate_cache_key(
+            task_id, latitude, longitude, requested_date, requested_time, country,
+        )
+        try:
+            cached = await (await get_redis()).get(cache_key)
+        except Exception as exc:
+            logger.warning("Price estimate cache read failed: %s", exc)
+            cached = None
+        if cached is not None:
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"X-Cache": "HIT"},
+            )
+
     try:
         estimate = await calculate_price(
             db=db,
@@ -99,7 +156,7 @@ async def get_price_estimate(
         )
 
     multiplier_details_out = [
-        MultiplierDetailOut(
+        MultiplierDetailOut.model_construct(
             rule_name=m.rule_name,
             rule_type=m.rule_type,
             multiplier=m.multiplier,
@@ -108,7 +165,10 @@ async def get_price_estimate(
         for m in estimate.multiplier_details
     ]
 
-    return PriceEstimateOut(
+    # The engine emits the schema's field types, so the DTOs are built with
+    # model_construct and rendered once; response_model is kept for the
+    # OpenAPI schema only.
+    estimate_out = PriceEstimateOut.model_construct(
         task_id=estimate.task_id,
         task_name=estimate.task_name,
         level=estimate.level,
@@ -128,6 +188,21 @@ async def get_price_estimate(
         provider_payout_max_cents=estimate.provider_payout_max_cents,
         currency=estimate.currency,
     )
+    body = estimate_out.model_dump_json()
+
+    if cache_key is not None:
+        try:
+            await (await get_redis()).set(
+                cache_key, body, ex=_ESTIMATE_CACHE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Price estimate cache write failed: %s", exc)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": "MISS"},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -147,8 +222,18 @@ async def get_price_estimate(
 )
 async def get_job_price_breakdown(
     job_id: uuid.UUID,
+    request: Request,
     db: DBSession,
-) -> PriceBreakdownOut:
+) -> Response:
+    etag = None
+    version = await get_price_breakdown_version(db, job_id)
+    if version is not None:
+        etag = version_etag(job_id, *version)
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            unchanged.headers["Cache-Control"] = _BREAKDOWN_CACHE_CONTROL
+            return unchanged
+
     try:
         breakdown = await get_price_breakdown(db=db, job_id=job_id)
     except ValueError as exc:
@@ -164,7 +249,7 @@ async def get_job_price_breakdown(
         )
 
     multiplier_details_out = [
-        MultiplierDetailOut(
+        MultiplierDetailOut.model_construct(
             rule_name=m.rule_name,
             rule_type=m.rule_type,
             multiplier=m.multiplier,
@@ -174,7 +259,7 @@ async def get_job_price_breakdown(
     ]
 
     rules_out = [
-        PriceBreakdownRuleOut(
+        PriceBreakdownRuleOut.model_construct(
             rule_id=r.rule_id,
             rule_name=r.rule_name,
             rule_type=r.rule_type,
@@ -185,7 +270,7 @@ async def get_job_price_breakdown(
         for r in breakdown.rules_applied
     ]
 
-    return PriceBreakdownOut(
+    breakdown_out = PriceBreakdownOut.model_construct(
         job_id=breakdown.job_id,
         task_id=breakdown.task_id,
         task_name=breakdown.task_name,
@@ -203,3 +288,8 @@ async def get_job_price_breakdown(
         currency=breakdown.currency,
         calculated_at=breakdown.calculated_at,
     )
+    response = conditional_json_response(
+        request, breakdown_out.model_dump_json().encode(), etag=etag
+    )
+    response.headers["Cache-Control"] = _BREAKDOWN_CACHE_CONTROL
+    return response
@@ -20,11 +20,13 @@ Routes:
 from __future__ import annotations
 
 import uuid
-from typing import Any, Optional
+from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import JSONResponse, Response
 
 from src.api.deps import CurrentUser, DBSession
+from src.api.responses import data_response
 from src.api.schemas.provider import (
     ActiveJobSummary,
     AssignmentOut,
@@ -72,6 +74,7 @@ async def _get_provider_id(db: DBSession, user: CurrentUser) -> uuid.UUID:
 
 @router.get(
     "/dashboard",
+    response_class=JSONResponse,
     summary="Provider dashboard stats",
     description=(
         "Returns aggregated dashboard data for the authenticated provider: "
@@ -82,7 +85,7 @@ async def _get_provider_id(db: DBSession, user: CurrentUser) -> uuid.UUID:
 async def get_dashboard(
     db: DBSession,
     user: CurrentUser,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -110,7 +113,7 @@ async def get_dashboard(
         availability_status=dashboard["availability_status"],
     )
 
-    return {"data": result.model_dump(by_alias=True)}
+    return data_response(result)
 
 
 # ---------------------------------------------------------------------------
@@ -119,6 +122,7 @@ async def get_dashboard(
 
 @router.get(
     "/offers",
+    response_class=JSONResponse,
     summary="List pending job offers",
     description=(
         "Returns all pending job offers for the authenticated provider, "
@@ -128,7 +132,7 @@ async def get_dashboard(
 async def list_offers(
     db: DBSession,
     user: CurrentUser,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -161,9 +165,9 @@ async def list_offers(
             offered_at=offer["offered_at"],
             offer_expires_at=offer["offer_expires_at"],
         )
-        items.append(item.model_dump(by_alias=True))
+        items.append(item)
 
-    return {"data": {"items": items}}
+    return data_response({"items": items})
 
 
 # ---------------------------------------------------------------------------
@@ -172,6 +176,7 @@ async def list_offers(
 
 @router.post(
     "/offers/{job_id}/accept",
+    response_class=JSONResponse,
     summary="Accept a job offer",
     description="Accept a pending job offer. Transitions the job to PROVIDER_ACCEPTED.",
 )
@@ -179,7 +184,7 @@ async def accept_offer(
     db: DBSession,
     user: CurrentUser,
     job_id: uuid.UUID,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -211,7 +216,7 @@ async def accept_offer(
         sla_arrival_deadline=assignment.sla_arrival_deadline,
     )
 
-    return {"data": {"assignment": result.model_dump(by_alias=True)}}
+    return data_response({"assignment": result})
 
 
 # ---------------------------------------------------------------------------
@@ -220,6 +225,7 @@ async def accept_offer(
 
 @router.post(
     "/offers/{job_id}/reject",
+    response_class=JSONResponse,
     summary="Reject a job offer",
     description="Reject a pending job offer. The matching engine may reassign.",
 )
@@ -228,7 +234,7 @@ async def reject_offer(
     user: CurrentUser,
     job_id: uuid.UUID,
     body: Optional[OfferRejectRequest] = None,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -252,7 +258,7 @@ async def reject_offer(
             detail=str(exc),
         )
 
-    return {"data": None}
+    return data_response(None)
 
 
 # ---------------------------------------------------------------------------
@@ -261,6 +267,7 @@ async def reject_offer(
 
 @router.patch(
     "/status",
+    response_class=JSONResponse,
     summary="Update provider availability status",
     description="Set the provider's availability status: ONLINE, OFFLINE, ON_CALL, or BUSY.",
 )
@@ -268,7 +275,7 @@ async def update_status(
     db: DBSession,
     user: CurrentUser,
     body: ProviderStatusUpdateRequest,
-) -> dict[str, Any]:
+) -> Response:
     try:
         profile = await providerService.get_provider_profile(db, user.id)
     except providerService.ProviderNotFoundError:
@@ -283,7 +290,7 @@ async def update_status(
     # so we use a lightweight approach: log it and return success.
     # TODO: Add availability_status column or use Redis.
 
-    return {"data": {"status": body.status}}
+    return data_response({"status": body.status})
 
 
 # ---------------------------------------------------------------------------
@@ -292,6 +299,7 @@ async def update_status(
 
 @router.get(
     "/earnings",
+    response_class=JSONResponse,
     summary="Provider earnings summary",
     description=(
         "Returns earnings summary for the authenticated provider. "
@@ -306,7 +314,7 @@ async def get_earnings(
         pattern=r"^(today|week|month|all)$",
         description="Time period for earnings calculation",
     ),
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -327,7 +335,7 @@ async def get_earnings(
         jobs=[EarningsJobSummary(**j) for j in earnings["jobs"]],
     )
 
-    return {"data": result.model_dump(by_alias=True)}
+    return data_response(result)
 
 
 # ---------------------------------------------------------------------------
@@ -336,13 +344,14 @@ async def get_earnings(
 
 @router.get(
     "/schedule",
+    response_class=JSONResponse,
     summary="Provider schedule",
     description="Returns upcoming jobs and on-call shifts for the provider.",
 )
 async def get_schedule(
     db: DBSession,
     user: CurrentUser,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -358,7 +367,7 @@ async def get_schedule(
         shifts=[OnCallShiftOut(**s) for s in schedule["shifts"]],
     )
 
-    return {"data": result.model_dump(by_alias=True)}
+    return data_response(result)
 
 
 # ---------------------------------------------------------------------------
@@ -367,6 +376,7 @@ async def get_schedule(
 
 @router.get(
     "/credentials",
+    response_class=JSONResponse,
     summary="Provider credentials and verification status",
     description=(
         "Returns the provider's credentials, insurance policies, "
@@ -376,7 +386,7 @@ async def get_schedule(
 async def get_credentials(
     db: DBSession,
     user: CurrentUser,
-) -> dict[str, Any]:
+) -> Response:
     try:
         provider_id = await _get_provider_id(db, user)
     except providerService.ProviderNotFoundError:
@@ -393,4 +403,4 @@ async def get_credentials(
         background_check=BackgroundCheckOut(**creds["background_check"]),
     )
 
-    return {"data": result.model_dump(by_alias=True)}
+    return data_response(result)
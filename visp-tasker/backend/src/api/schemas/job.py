@@ -12,9 +12,33 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, field_validator
+
+
+# ---------------------------------------------------------------------------
+# Customer note selections
+# ---------------------------------------------------------------------------
+
+# Notes are picked from a predefined list on the client, so a handful of short
+# labels is all a legitimate request carries.  Bounding both the list and each
+# entry rejects oversized payloads at validation time, before they are copied
+# into the JSONB column.
+MAX_CUSTOMER_NOTES: int = 20
+MAX_CUSTOMER_NOTE_LENGTH: int = 200
+
+CustomerNote = Annotated[str, Field(max_length=MAX_CUSTOMER_NOTE_LENGTH)]
+
+
+# ---------------------------------------------------------------------------
+# JSON number decimals
+# ---------------------------------------------------------------------------
+
+# Decimal that serialises as a JSON number (matching FastAPI's
+# ``jsonable_encoder``) when dumped with ``mode="json"``, instead of
+# Pydantic's default string form.
+JsonDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
 
 
 # ---------------------------------------------------------------------------
@@ -30,6 +54,34 @@ class PaginationMeta(BaseModel):
     total_pages: int = Field(ge=0, description="Total number of pages")
 
 
+class CursorPaginationMeta(PaginationMeta):
+    """Pagination metadata for lists that also support keyset cursors.
+
+    When the request carried a ``cursor``, ``total_items`` and
+    ``total_pages`` count only the items from that cursor onwards, not the
+    whole list.
+    """
+
+    total_items: int = Field(
+        ge=0,
+        description=(
+            "Total number of matching items; with a cursor, only those "
+            "from the cursor onwards"
+        ),
+    )
+    total_pages: int = Field(
+        ge=0,
+        description=(
+            "Total number of pages; with a cursor, counted from the "
+            "cursor onwards"
+        ),
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page; null on the last page",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Location input
 # ---------------------------------------------------------------------------
@@ -81,8 +133,9 @@ class JobCreateRequest(BaseModel):
         description="Job priority level",
     )
     is_emergency: bool = Field(default=False, description="Flag for emergency jobs")
-    customer_notes_json: list[str] = Field(
+    customer_notes_json: list[CustomerNote] = Field(
         default_factory=list,
+        max_length=MAX_CUSTOMER_NOTES,
         description="Predefined customer note selections (NOT free text)",
     )
 
@@ -180,8 +233,8 @@ class JobOut(BaseModel):
     is_emergency: bool
 
     # Location
-    service_latitude: Decimal
-    service_longitude: Decimal
+    service_latitude: JsonDecimal
+    service_longitude: JsonDecimal
     service_address: str
     service_unit: Optional[str] = None
     service_city: Optional[str] = None
@@ -245,7 +298,7 @@ class JobListResponse(BaseModel):
     """Paginated list of jobs."""
 
     data: list[JobBrief]
-    meta: PaginationMeta
+    meta: CursorPaginationMeta
 
 
 # ---------------------------------------------------------------------------
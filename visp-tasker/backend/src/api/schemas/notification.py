@@ -100,12 +100,33 @@ class NotificationHistoryResponse(BaseModel):
 
 
 class PaginationMeta(BaseModel):
-    """Pagination metadata for list responses."""
+    """Pagination metadata for list responses.
+
+    When the request carried a ``cursor``, ``total_items`` and
+    ``total_pages`` count only the notifications from that cursor onwards,
+    not the whole history.
+    """
 
     page: int = Field(ge=1, description="Current page number (1-indexed)")
     page_size: int = Field(ge=1, description="Number of items per page")
-    total_items: int = Field(ge=0, description="Total number of matching items")
-    total_pages: int = Field(ge=0, description="Total number of pages")
+    total_items: int = Field(
+        ge=0,
+        description=(
+            "Total number of matching items; with a cursor, only those "
+            "from the cursor onwards"
+        ),
+    )
+    total_pages: int = Field(
+        ge=0,
+        description=(
+            "Total number of pages; with a cursor, counted from the "
+            "cursor onwards"
+        ),
+    )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page; null on the last page",
+    )
 
 
 # Fix forward reference: re-define NotificationHistoryResponse after PaginationMeta
@@ -167,16 +188,20 @@ class NotificationPreferencesRequest(BaseModel):
 
 
 class NotificationPreferencesOut(BaseModel):
-    """Current notification preference settings for a user."""
+    """Current notification preference settings for a user.
+
+    ``id`` and the timestamps are null when the user has never saved
+    preferences and the defaults are being reported.
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
-    id: uuid.UUID
+    id: Optional[uuid.UUID] = None
     user_id: uuid.UUID
     job_updates: bool
     payment_updates: bool
     marketing: bool
     sla_warnings: bool
     emergency_alerts: bool
-    created_at: datetime
-    updated_at: datetime
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -250,6 +250,14 @@ class PayoutListOut(BaseModel):
     count: int = Field(description="Number of payouts returned")
 
 
+class ProviderDashboardOut(BaseModel):
+    """Connect status, balance and recent payouts for a provider."""
+
+    account_status: AccountStatusOut
+    balance: BalanceOut
+    payouts: PayoutListOut
+
+
 # ---------------------------------------------------------------------------
 # Webhook schemas
 # ---------------------------------------------------------------------------
@@ -16,7 +16,12 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from src.api.schemas.job import PaginationMeta
+from src.api.schemas.job import (
+    MAX_CUSTOMER_NOTES,
+    CustomerNote,
+    JsonDecimal,
+    PaginationMeta,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -106,7 +111,7 @@ class ProviderDashboardOut(BaseModel):
     """Provider dashboard aggregated data."""
     today_jobs: int = Field(alias="todayJobs")
     week_earnings_cents: int = Field(alias="weekEarningsCents")
-    rating: Optional[Decimal] = None
+    rating: Optional[JsonDecimal] = None
     total_completed_jobs: int = Field(alias="totalCompletedJobs")
     active_job: Optional[ActiveJobSummary] = Field(default=None, alias="activeJob")
     recent_jobs: list[RecentJobSummary] = Field(default_factory=list, alias="recentJobs")
@@ -129,13 +134,13 @@ class OfferCustomerInfo(BaseModel):
     """Minimal customer info within a job offer."""
     id: uuid.UUID
     display_name: Optional[str] = Field(default=None, alias="displayName")
-    rating: Optional[Decimal] = None
+    rating: Optional[JsonDecimal] = None
 
 
 class OfferPricingInfo(BaseModel):
     """Pricing details within a job offer."""
     quoted_price_cents: Optional[int] = Field(default=None, alias="quotedPriceCents")
-    commission_rate: Optional[Decimal] = Field(default=None, alias="commissionRate")
+    commission_rate: Optional[JsonDecimal] = Field(default=None, alias="commissionRate")
     estimated_payout_cents: Optional[int] = Field(default=None, alias="estimatedPayoutCents")
     currency: str = "CAD"
 
@@ -160,8 +165,8 @@ class JobOfferOut(BaseModel):
     is_emergency: bool = Field(alias="isEmergency")
     service_address: str = Field(alias="serviceAddress")
     service_city: Optional[str] = Field(default=None, alias="serviceCity")
-    service_latitude: Decimal = Field(alias="serviceLatitude")
-    service_longitude: Decimal = Field(alias="serviceLongitude")
+    service_latitude: JsonDecimal = Field(alias="serviceLatitude")
+    service_longitude: JsonDecimal = Field(alias="serviceLongitude")
     requested_date: Optional[date] = Field(default=None, alias="requestedDate")
     requested_time_start: Optional[time] = Field(default=None, alias="requestedTimeStart")
 
@@ -324,8 +329,10 @@ class CredentialsSummaryOut(BaseModel):
 
 class JobTrackingOut(BaseModel):
     """Real-time job tracking information."""
-    provider_lat: Optional[Decimal] = Field(default=None, alias="providerLat")
-    provider_lng: Optional[Decimal] = Field(default=None, alias="providerLng")
+    model_config = ConfigDict(populate_by_name=True)
+
+    provider_lat: Optional[JsonDecimal] = Field(default=None, alias="providerLat")
+    provider_lng: Optional[JsonDecimal] = Field(default=None, alias="providerLng")
     eta_minutes: Optional[int] = Field(default=None, alias="etaMinutes")
     status: str
     provider_name: Optional[str] = Field(default=None, alias="providerName")
@@ -344,7 +351,7 @@ class MobileJobCreateRequest(BaseModel):
     location_lng: Decimal = Field(alias="locationLng", ge=-180, le=180)
     scheduled_at: Optional[datetime] = Field(default=None, alias="scheduledAt")
     is_emergency: bool = Field(default=False, alias="isEmergency")
-    notes: Optional[list[str]] = None
+    notes: Optional[list[CustomerNote]] = Field(default=None, max_length=MAX_CUSTOMER_NOTES)
 
     # Optional address components
     city: Optional[str] = None
@@ -360,7 +367,7 @@ class MobileJobCreateRequest(BaseModel):
 
 class MobileJobOut(BaseModel):
     """Job detail in camelCase format for mobile clients."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
     id: uuid.UUID
     reference_number: str = Field(alias="referenceNumber")
@@ -373,8 +380,8 @@ class MobileJobOut(BaseModel):
     # Location
     service_address: str = Field(alias="serviceAddress")
     service_city: Optional[str] = Field(default=None, alias="serviceCity")
-    service_latitude: Decimal = Field(alias="serviceLatitude")
-    service_longitude: Decimal = Field(alias="serviceLongitude")
+    service_latitude: JsonDecimal = Field(alias="serviceLatitude")
+    service_longitude: JsonDecimal = Field(alias="serviceLongitude")
 
     # Pricing
     quoted_price_cents: Optional[int] = Field(default=None, alias="quotedPriceCents")
@@ -402,14 +409,18 @@ class MobileJobStatusUpdateRequest(BaseModel):
 
 class EstimatedPriceOut(BaseModel):
     """Estimated price returned with job creation."""
+    model_config = ConfigDict(populate_by_name=True)
+
     min_cents: int = Field(alias="minCents")
     max_cents: int = Field(alias="maxCents")
     currency: str = "CAD"
     is_emergency: bool = Field(alias="isEmergency")
-    dynamic_multiplier: Optional[Decimal] = Field(default=None, alias="dynamicMultiplier")
+    dynamic_multiplier: Optional[JsonDecimal] = Field(default=None, alias="dynamicMultiplier")
 
 
 class JobCreateResponse(BaseModel):
     """Response from job creation containing the job and estimated price."""
+    model_config = ConfigDict(populate_by_name=True)
+
     job: MobileJobOut
     estimated_price: EstimatedPriceOut = Field(alias="estimatedPrice")
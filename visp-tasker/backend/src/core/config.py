@@ -28,6 +28,19 @@ class Settings(BaseSettings):
     sql_echo: bool = False
     db_pool_size: int = 10
     db_max_overflow: int = 20
+    # Seconds to wait for a pooled connection before failing the request,
+    # and the age after which a connection is replaced on checkout.
+    db_pool_timeout: int = 10
+    db_pool_recycle: int = 1800
+    db_query_cache_size: int = 1200
+    # Per-connection cache of asyncpg server-side prepared statements.  Set
+    # to 0 when connecting through a transaction-pooling PgBouncer, which
+    # cannot keep prepared statements across transactions.
+    db_prepared_statement_cache_size: int = 500
+    # Set when DATABASE_URL points at PgBouncer in transaction-pooling mode:
+    # disables statement caching and gives every prepared statement a unique
+    # name so server connections shared between clients never collide.
+    db_pgbouncer_transaction_mode: bool = False
 
     # -- Redis --
     redis_url: str = "redis://localhost:6379/0"
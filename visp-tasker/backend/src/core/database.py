@@ -0,0 +1,56 @@
+"""
+Async database engine and session factory for the VISP/Tasker backend.
+
+Lives in ``src.core`` so services, realtime handlers and background jobs can
+open their own sessions without depending on the API layer.  Request-scoped
+sessions come from the ``get_db`` dependency in ``src.api.deps``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+
+# ---------------------------------------------------------------------------
+# Async engine & session factory
+# ---------------------------------------------------------------------------
+# The engine is created once at module import time.  The session factory
+# produces lightweight ``AsyncSession`` instances that are scoped to a single
+# request via the ``get_db`` dependency in ``src.api.deps``.
+# ---------------------------------------------------------------------------
+
+if settings.db_pgbouncer_transaction_mode:
+    # PgBouncer may run each transaction on a different server connection,
+    # so no prepared statement can be cached, and names must be unique
+    # across all clients sharing that connection.
+    _connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": 0,
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+else:
+    _connect_args = {
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+
+engine = create_async_engine(
+    settings.database_url,
+    echo=settings.sql_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    query_cache_size=settings.db_query_cache_size,
+    connect_args=_connect_args,
+)
+
+async_session_factory = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
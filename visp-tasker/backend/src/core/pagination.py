@@ -0,0 +1,34 @@
+"""
+Keyset cursor codec shared by the paginated list endpoints.
+
+Lists ordered by ``(created_at DESC, id DESC)`` -- jobs and notification
+history -- page by keyset on that pair.  The position is handed to clients
+as an opaque URL-safe cursor (``next_cursor`` in the pagination metadata).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import uuid
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at_str, row_id_str = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_str), uuid.UUID(row_id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor '{cursor}'.") from exc
@@ -34,6 +34,7 @@ from src.integrations.maps.geocoder import (
 )
 from src.integrations.maps.googleMapsService import (
     GoogleMapsError,
+    close_http_client,
     geocode_address,
     get_directions,
     get_distance_matrix,
@@ -44,6 +45,7 @@ from src.integrations.maps.googleMapsService import (
 __all__ = [
     # googleMapsService
     "GoogleMapsError",
+    "close_http_client",
     "geocode_address",
     "reverse_geocode",
     "get_directions",
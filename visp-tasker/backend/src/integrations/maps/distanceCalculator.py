@@ -43,6 +43,11 @@ _HAVERSINE_ROAD_FACTOR: Final[float] = 1.3
 # fallback.  40 km/h accounts for city driving with stops.
 _FALLBACK_AVG_SPEED_KMH: Final[float] = 40.0
 
+# Straight-line distance (km) below which the Directions API is skipped
+# entirely.  For trips this short the road-factor estimate is within the
+# API's own rounding noise, so the upstream round-trip is not worth it.
+_SHORT_TRIP_THRESHOLD_KM: Final[float] = 0.5
+
 # Maximum number of destinations per batch request (Google API limit is
 # 25 origins or destinations, 100 elements total).
 _MAX_BATCH_DESTINATIONS: Final[int] = 25
@@ -103,7 +108,9 @@ async def calculate_driving_distance(
 
     Tries the Google Maps Directions API first for accurate route data
     (including a polyline).  Falls back to haversine * 1.3 if the API
-    call fails for any reason.
+    call fails for any reason.  Trips shorter than
+    ``_SHORT_TRIP_THRESHOLD_KM`` in straight-line distance are answered
+    with the haversine estimate directly, without calling the API.
 
     Args:
         origin_lat: Origin latitude.
@@ -116,6 +123,10 @@ async def calculate_driving_distance(
         optional encoded polyline.  The ``is_fallback`` flag indicates
         whether the result came from the haversine estimate.
     """
+    straight_line_km = haversine_distance(origin_lat, origin_lng, dest_lat, dest_lng)
+    if straight_line_km < _SHORT_TRIP_THRESHOLD_KM:
+        return _haversine_fallback(origin_lat, origin_lng, dest_lat, dest_lng)
+
     try:
         data = await get_directions(
             origin=(origin_lat, origin_lng),
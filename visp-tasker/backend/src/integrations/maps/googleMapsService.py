@@ -5,8 +5,11 @@ Google Maps API wrapper service -- VISP-INT-MAPS-001
 Async wrapper around the Google Maps Platform APIs, providing geocoding,
 reverse geocoding, directions, distance matrix, and address validation.
 
-All HTTP calls use httpx with retry logic (3 attempts, exponential backoff).
-The API key is read from the GOOGLE_MAPS_API_KEY environment variable.
+All HTTP calls use httpx with retry logic (3 attempts, exponential backoff)
+over a single shared ``AsyncClient`` so that keep-alive connections to
+Google are reused across calls instead of paying a TCP+TLS handshake on
+every request.  The API key is read from the GOOGLE_MAPS_API_KEY
+environment variable.
 """
 
 from __future__ import annotations
@@ -31,6 +34,9 @@ _MAX_RETRIES = 3
 _INITIAL_BACKOFF_SECONDS = 0.5  # doubles each retry: 0.5, 1.0, 2.0
 _REQUEST_TIMEOUT_SECONDS = 10.0
 
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 50
+
 
 # ---------------------------------------------------------------------------
 # Custom exception
@@ -47,6 +53,35 @@ class GoogleMapsError(Exception):
         self.raw = raw
 
 
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Lazily initialize and return the shared, connection-pooled client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=_REQUEST_TIMEOUT_SECONDS,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client.  Call on app shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 # ---------------------------------------------------------------------------
 # Internal HTTP helpers
 # ---------------------------------------------------------------------------
@@ -189,12 +224,11 @@ async def geocode_address(address: str) -> dict[str, Any]:
     """
     key = _ensure_api_key()
 
-    async with httpx.AsyncClient() as client:
-        data = await _request_with_retry(
-            client,
-            f"{_BASE_URL}/geocode/json",
-            params={"address": address, "key": key},
-        )
+    data = await _request_with_retry(
+        _get_http_client(),
+        f"{_BASE_URL}/geocode/json",
+        params={"address": address, "key": key},
+    )
 
     _check_api_status(data, "Geocoding")
 
@@ -238,12 +272,11 @@ async def reverse_geocode(lat: float, lng: float) -> dict[str, Any]:
     """
     key = _ensure_api_key()
 
-    async with httpx.AsyncClient() as client:
-        data = await _request_with_retry(
-            client,
-            f"{_BASE_URL}/geocode/json",
-            params={"latlng": f"{lat},{lng}", "key": key},
-        )
+    data = await _request_with_retry(
+        _get_http_client(),
+        f"{_BASE_URL}/geocode/json",
+        params={"latlng": f"{lat},{lng}", "key": key},
+    )
 
     _check_api_status(data, "Reverse geocoding")
 
@@ -305,12 +338,11 @@ async def get_directions(
     if avoid:
         params["avoid"] = avoid
 
-    async with httpx.AsyncClient() as client:
-        data = await _request_with_retry(
-            client,
-            f"{_BASE_URL}/directions/json",
-            params=params,
-        )
+    data = await _request_with_retry(
+        _get_http_client(),
+        f"{_BASE_URL}/directions/json",
+        params=params,
+    )
 
     _check_api_status(data, "Directions")
 
@@ -401,12 +433,11 @@ async def get_distance_matrix(
     if departure_time:
         params["departure_time"] = departure_time
 
-    async with httpx.AsyncClient() as client:
-        data = await _request_with_retry(
-            client,
-            f"{_BASE_URL}/distancematrix/json",
-            params=params,
-        )
+    data = await _request_with_retry(
+        _get_http_client(),
+        f"{_BASE_URL}/distancematrix/json",
+        params=params,
+    )
 
     _check_api_status(data, "Distance matrix")
 
@@ -24,6 +24,9 @@ Usage::
         get_balance,
         list_payouts,
         handle_webhook,
+        verify_webhook,
+        claim_event,
+        process_event,
     )
 """
 
@@ -35,6 +38,7 @@ from .paymentService import (
     RefundResult,
     attach_payment_method,
     cancel_payment,
+    close_http_client,
     confirm_payment,
     create_customer,
     create_payment_intent,
@@ -68,7 +72,10 @@ from .subscriptionService import (
 )
 from .webhookHandler import (
     WebhookResult,
+    claim_event,
     handle_webhook,
+    process_event,
+    verify_webhook,
 )
 
 __all__ = [
@@ -86,6 +93,7 @@ __all__ = [
     "attach_payment_method",
     "list_payment_methods",
     "get_payment_status",
+    "close_http_client",
     # Payout Service
     "ConnectedAccountResult",
     "AccountStatus",
@@ -111,4 +119,7 @@ __all__ = [
     # Webhook Handler
     "WebhookResult",
     "handle_webhook",
+    "verify_webhook",
+    "claim_event",
+    "process_event",
 ]
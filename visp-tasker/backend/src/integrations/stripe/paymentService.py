@@ -32,6 +32,22 @@ logger = logging.getLogger(__name__)
 stripe.api_key = os.environ.get("STRIPE_SECRET_KEY", "")
 stripe.api_version = "2024-06-20"
 
+# Seconds before a Stripe API request is abandoned.
+STRIPE_HTTP_TIMEOUT_SECONDS = 30
+
+# One HTTP client for every Stripe call in the process, installed before any
+# request is made, so calls reuse pooled keep-alive connections instead of
+# each paying a fresh TCP + TLS handshake.  RequestsClient is exported at
+# the top level from stripe 8; older releases only have it under
+# stripe.http_client.
+_RequestsClient = getattr(stripe, "RequestsClient", None) or stripe.http_client.RequestsClient
+stripe.default_http_client = _RequestsClient(timeout=STRIPE_HTTP_TIMEOUT_SECONDS)
+
+
+def close_http_client() -> None:
+    """Close the shared Stripe HTTP client's pooled connections.  Call on app shutdown."""
+    stripe.default_http_client.close()
+
 STRIPE_PUBLISHABLE_KEY = os.environ.get("STRIPE_PUBLISHABLE_KEY", "")
 STRIPE_WEBHOOK_SECRET = os.environ.get("STRIPE_WEBHOOK_SECRET", "")
 
@@ -17,6 +17,7 @@ All monetary amounts are in cents (integers).
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import uuid
@@ -216,7 +217,7 @@ async def check_account_status(account_id: str) -> AccountStatus:
         PaymentError: If the retrieval fails.
     """
     try:
-        account = stripe.Account.retrieve(account_id)
+        account = await asyncio.to_thread(stripe.Account.retrieve, account_id)
     except stripe.StripeError as exc:
         raise _handle_stripe_error(exc) from exc
 
@@ -381,7 +382,9 @@ async def get_balance(account_id: str) -> BalanceInfo:
         PaymentError: If the retrieval fails.
     """
     try:
-        balance = stripe.Balance.retrieve(stripe_account=account_id)
+        balance = await asyncio.to_thread(
+            stripe.Balance.retrieve, stripe_account=account_id
+        )
     except stripe.StripeError as exc:
         raise _handle_stripe_error(exc) from exc
 
@@ -424,7 +427,8 @@ async def list_payouts(
     clamped_limit = max(1, min(limit, 100))
 
     try:
-        payouts = stripe.Payout.list(
+        payouts = await asyncio.to_thread(
+            stripe.Payout.list,
             limit=clamped_limit,
             stripe_account=account_id,
         )
@@ -31,6 +31,8 @@ from threading import Lock
 
 import stripe
 
+from src.realtime.socketServer import get_redis
+
 logger = logging.getLogger(__name__)
 
 STRIPE_WEBHOOK_SECRET = os.environ.get("STRIPE_WEBHOOK_SECRET", "")
@@ -69,6 +71,44 @@ def clear_processed_events() -> None:
         _processed_events.clear()
 
 
+# Cross-instance delivery claims.  Stripe delivers at least once, and a retry
+# can land on any instance, so the first delivery of an event id claims it
+# in Redis with SET NX; later deliveries within the TTL are dropped before
+# any processing.  A claim is released when processing fails so Stripe's
+# next retry runs again.
+_EVENT_CLAIM_PREFIX = "visp:stripe:event:"
+_EVENT_CLAIM_TTL_SECONDS = 86_400
+
+
+async def claim_event(event_id: str) -> bool:
+    """Claim an event id for processing; False if another delivery has it.
+
+    Redis failures fail open (the claim succeeds) and leave deduplication
+    to the in-process idempotency store.
+    """
+    try:
+        redis = await get_redis()
+        claimed = await redis.set(
+            f"{_EVENT_CLAIM_PREFIX}{event_id}",
+            "1",
+            nx=True,
+            ex=_EVENT_CLAIM_TTL_SECONDS,
+        )
+    except Exception as exc:
+        logger.warning("Webhook event claim failed for %s: %s", event_id, exc)
+        return True
+    return bool(claimed)
+
+
+async def release_event(event_id: str) -> None:
+    """Release a claim so a redelivery of the event is processed again."""
+    try:
+        redis = await get_redis()
+        await redis.delete(f"{_EVENT_CLAIM_PREFIX}{event_id}")
+    except Exception as exc:
+        logger.warning("Webhook event release failed for %s: %s", event_id, exc)
+
+
 # ---------------------------------------------------------------------------
 # Response dataclass
 # ---------------------------------------------------------------------------
@@ -275,31 +315,27 @@ _EVENT_HANDLERS: dict[str, callable] = {
 # Public API
 # ---------------------------------------------------------------------------
 
-async def handle_webhook(
+def verify_webhook(
     payload: bytes,
     sig_header: str,
-) -> WebhookResult:
-    """Verify and process an inbound Stripe webhook event.
+) -> stripe.Event:
+    """Verify an inbound Stripe webhook and parse it into an event.
 
-    Steps:
-    1. Verify the webhook signature against STRIPE_WEBHOOK_SECRET
-    2. Check idempotency (skip if event already processed)
-    3. Dispatch to the appropriate handler based on event type
-    4. Mark the event as processed
+    This is the only work that has to happen before the delivery is
+    acknowledged; processing can follow with ``process_event``.
 
     Args:
         payload: The raw request body bytes from the webhook POST.
         sig_header: The ``Stripe-Signature`` header value.
 
     Returns:
-        WebhookResult indicating what happened.
+        The verified Stripe event.
 
     Raises:
         ValueError: If the webhook signature verification fails.
     """
-    # 1. Verify signature
     try:
-        event = stripe.Webhook.construct_event(
+        return stripe.Webhook.construct_event(
             payload=payload,
             sig_header=sig_header,
             secret=STRIPE_WEBHOOK_SECRET,
@@ -311,10 +347,29 @@ async def handle_webhook(
         logger.warning("Webhook payload parsing failed: %s", str(exc))
         raise ValueError(f"Invalid webhook payload: {str(exc)}") from exc
 
+
+async def process_event(event: stripe.Event) -> WebhookResult:
+    """Process a verified Stripe event idempotently.
+
+    Steps:
+    1. Check idempotency (skip if event already processed)
+    2. Dispatch to the appropriate handler based on event type
+    3. Mark the event as processed
+
+    Handler failures are logged and reported in the result; the event is
+    left unmarked and its delivery claim released so a redelivery can
+    retry it.
+
+    Args:
+        event: An event returned by ``verify_webhook``.
+
+    Returns:
+        WebhookResult indicating what happened.
+    """
     event_id: str = event.id
     event_type: str = event.type
 
-    # 2. Idempotency check
+    # 1. Idempotency check
     if _is_event_processed(event_id):
         logger.info(
             "Webhook event already processed, skipping: id=%s, type=%s",
@@ -327,7 +382,7 @@ async def handle_webhook(
             message=f"Event {event_id} already processed (idempotent skip)",
         )
 
-    # 3. Dispatch to handler
+    # 2. Dispatch to handler
     handler = _EVENT_HANDLERS.get(event_type)
     if handler is None:
         logger.info(
@@ -350,14 +405,16 @@ async def handle_webhook(
             event_id,
             event_type,
         )
-        # Do NOT mark as processed so it can be retried
+        # Do NOT mark as processed, and drop the delivery claim, so a
+        # redelivery can retry it
+        await release_event(event_id)
         return WebhookResult(
             event_type=event_type,
             processed=False,
             message=f"Error processing event {event_id}",
         )
 
-    # 4. Mark processed
+    # 3. Mark processed
     _mark_event_processed(event_id)
 
     logger.info(
@@ -371,3 +428,25 @@ async def handle_webhook(
         processed=True,
         message=message,
     )
+
+
+async def handle_webhook(
+    payload: bytes,
+    sig_header: str,
+) -> WebhookResult:
+    """Verify and process an inbound Stripe webhook event in one call.
+
+    Equivalent to ``verify_webhook`` followed by ``process_event``.
+
+    Args:
+        payload: The raw request body bytes from the webhook POST.
+        sig_header: The ``Stripe-Signature`` header value.
+
+    Returns:
+        WebhookResult indicating what happened.
+
+    Raises:
+        ValueError: If the webhook signature verification fails.
+    """
+    event = verify_webhook(payload, sig_header)
+    return await process_event(event)
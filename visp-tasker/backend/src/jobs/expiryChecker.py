@@ -266,7 +266,7 @@ async def _cli_main() -> None:
 
     Creates its own database session via the application session factory.
     """
-    from src.api.deps import async_session_factory
+    from src.core.database import async_session_factory
 
     async with async_session_factory() as session:
         try:
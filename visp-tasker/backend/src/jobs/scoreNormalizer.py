@@ -134,7 +134,7 @@ async def run_weekly_score_normalization(
 
 async def _cli_main() -> None:
     """Entry point for running the score normalizer from the command line."""
-    from src.api.deps import async_session_factory
+    from src.core.database import async_session_factory
 
     async with async_session_factory() as session:
         try:
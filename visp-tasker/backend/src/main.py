@@ -32,6 +32,8 @@ async def lifespan(app: FastAPI):
 
     Shutdown:
       - Close the shared Redis client used by the realtime module.
+      - Close the shared Google Maps HTTP client.
+      - Close the shared Stripe HTTP client.
     """
     # Importing handlers is sufficient to register all Socket.IO events
     from src.realtime import handlers  # noqa: F401
@@ -47,6 +49,20 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    try:
+        from src.integrations.maps import close_http_client
+
+        await close_http_client()
+    except Exception:
+        pass
+
+    try:
+        from src.integrations.stripe import close_http_client as close_stripe_client
+
+        close_stripe_client()
+    except Exception:
+        pass
+
 
 # ---------------------------------------------------------------------------
 # Application instance
@@ -82,6 +98,21 @@ async def health():
     return {"status": "ok", "version": settings.app_version}
 
 
+@app.get("/health/pool", tags=["Health"])
+async def health_pool():
+    """Connection pool counters for this worker, for spotting pool exhaustion."""
+    from src.core.database import engine
+
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Register API route modules
 # ---------------------------------------------------------------------------
@@ -106,6 +137,7 @@ from src.api.routes import (  # noqa: E402
     tasks,
     verification,
 )
+from src.integrations.stripe import PaymentError  # noqa: E402
 
 _prefix = settings.api_v1_prefix
 
@@ -124,6 +156,8 @@ app.include_router(payments.router, prefix=_prefix)
 app.include_router(chat.router, prefix=_prefix)
 app.include_router(notifications.router, prefix=_prefix)
 
+app.add_exception_handler(PaymentError, payments.payment_error_handler)
+
 
 # ---------------------------------------------------------------------------
 # Mount Socket.IO ASGI application
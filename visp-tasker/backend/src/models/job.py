@@ -183,6 +183,14 @@ class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     )
     cancellation_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Optimistic lock: every UPDATE checks and bumps this counter, so two
+    # racing status changes cannot both land (migration 012).
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="1"
+    )
+
+    __mapper_args__ = {"version_id_col": version}
+
     # Relationships
     customer: Mapped["User"] = relationship(
         "User", back_populates="customer_jobs", foreign_keys=[customer_id]
@@ -10,7 +10,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -161,8 +161,23 @@ class Notification(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     __table_args__ = (
         Index("ix_notifications_user_id", "user_id"),
-        Index("ix_notifications_user_unread", "user_id", "read"),
-        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # Partial index over unread rows only: serves the unread count as an
+        # index-only scan and unread history pages without a sort.
+        Index(
+            "ix_notifications_user_unread_created",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("read = false"),
+        ),
+        # Serves history pages ordered by (created_at DESC, id DESC), both
+        # OFFSET pages and keyset cursors.
+        Index(
+            "ix_notifications_user_created_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
         Index("ix_notifications_type", "notification_type"),
     )
 
@@ -24,6 +24,7 @@ from __future__ import annotations
 from .socketServer import (
     broadcast_emergency,
     broadcast_to_job,
+    emit_to_user,
     get_redis,
     send_to_user,
     sio,
@@ -38,6 +39,7 @@ __all__ = [
     "socket_app",
     "broadcast_to_job",
     "send_to_user",
+    "emit_to_user",
     "broadcast_emergency",
     "get_redis",
     "handlers",
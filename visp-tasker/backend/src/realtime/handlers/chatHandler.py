@@ -36,9 +36,10 @@ from typing import Any
 
 from sqlalchemy import select
 
-from src.api.deps import async_session_factory
+from src.core.database import async_session_factory
 from src.models.chat import ChatMessage, MessageType
-from src.models.job import Job, JobStatus
+from src.models.job import AssignmentStatus, Job, JobAssignment, JobStatus
+from src.models.provider import ProviderProfile
 from src.models.user import User
 
 from ..socketServer import (
@@ -163,8 +164,6 @@ async def _verify_chat_participant(
                 return True, None, job
 
             # Check if sender is the assigned provider
-            from src.models.job import AssignmentStatus, JobAssignment
-
             assign_stmt = select(JobAssignment).where(
                 JobAssignment.job_id == uuid.UUID(job_id),
                 JobAssignment.status.in_([
@@ -177,8 +176,6 @@ async def _verify_chat_participant(
 
             for assignment in assignments:
                 # Need to check the provider's user_id via provider_profiles
-                from src.models.provider import ProviderProfile
-
                 prov_stmt = select(ProviderProfile.user_id).where(
                     ProviderProfile.id == assignment.provider_id,
                 )
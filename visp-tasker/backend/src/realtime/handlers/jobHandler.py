@@ -30,13 +30,14 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.api.deps import async_session_factory
+from src.core.database import async_session_factory
 from src.models.job import (
     AssignmentStatus,
     Job,
@@ -154,6 +155,19 @@ async def _load_job_with_assignments(job_id: str) -> Job | None:
         return result.scalar_one_or_none()
 
 
+async def _lock_job(db: AsyncSession, job_id: str) -> Job | None:
+    """Re-load a job in the write session with ``SELECT ... FOR UPDATE``.
+
+    The transition is validated against a read from an earlier session, so
+    the row is locked until commit and callers re-check its status; two
+    handlers racing on the same job then serialise instead of the later
+    commit overwriting the earlier one.
+    """
+    stmt = select(Job).where(Job.id == uuid.UUID(job_id)).with_for_update()
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 # ---------------------------------------------------------------------------
 # Outbound event emitters (called by services or internal logic)
 # ---------------------------------------------------------------------------
@@ -364,11 +378,11 @@ async def handle_accept_offer(sid: str, data: dict[str, Any]) -> dict[str, Any]:
     # Persist changes
     async with async_session_factory() as db:
         # Re-load inside this session to avoid detached instance issues
-        job_stmt = select(Job).where(Job.id == uuid.UUID(job_id))
-        job_result = await db.execute(job_stmt)
-        db_job = job_result.scalar_one_or_none()
+        db_job = await _lock_job(db, job_id)
         if db_job is None:
             return {"ok": False, "error": "Job not found"}
+        if db_job.status != job.status:
+            return {"ok": False, "error": "Job status changed, please retry"}
 
         assign_stmt = select(JobAssignment).where(JobAssignment.id == assignment.id)
         assign_result = await db.execute(assign_stmt)
@@ -384,10 +398,8 @@ async def handle_accept_offer(sid: str, data: dict[str, Any]) -> dict[str, Any]:
 
         # Set SLA deadlines based on the job's snapshot
         if db_job.sla_arrival_time_min:
-            from datetime import timedelta
             db_assignment.sla_arrival_deadline = now + timedelta(minutes=db_job.sla_arrival_time_min)
         if db_job.sla_completion_time_min:
-            from datetime import timedelta
             db_assignment.sla_completion_deadline = now + timedelta(minutes=db_job.sla_completion_time_min)
 
         await db.commit()
@@ -431,6 +443,11 @@ async def handle_decline_offer(sid: str, data: dict[str, Any]) -> dict[str, Any]
     now = datetime.now(timezone.utc)
 
     async with async_session_factory() as db:
+        # Lock the job before touching the assignment -- the same
+        # jobs-then-job_assignments order as the other socket handlers and
+        # the REST accept_offer -- so racing accept/decline cannot deadlock.
+        db_job = await _lock_job(db, job_id)
+
         assign_stmt = select(JobAssignment).where(JobAssignment.id == assignment.id)
         assign_result = await db.execute(assign_stmt)
         db_assignment = assign_result.scalar_one_or_none()
@@ -442,10 +459,6 @@ async def handle_decline_offer(sid: str, data: dict[str, Any]) -> dict[str, Any]
         db_assignment.decline_reason = reason
 
         # Transition job back to pending_match for re-matching
-        job_stmt = select(Job).where(Job.id == uuid.UUID(job_id))
-        job_result = await db.execute(job_stmt)
-        db_job = job_result.scalar_one_or_none()
-
         old_status = ""
         if db_job and db_job.status == JobStatus.MATCHED:
             old_status = db_job.status.value
@@ -499,11 +512,11 @@ async def handle_mark_en_route(sid: str, data: dict[str, Any]) -> dict[str, Any]
     now = datetime.now(timezone.utc)
 
     async with async_session_factory() as db:
-        job_stmt = select(Job).where(Job.id == uuid.UUID(job_id))
-        job_result = await db.execute(job_stmt)
-        db_job = job_result.scalar_one_or_none()
+        db_job = await _lock_job(db, job_id)
         if db_job is None:
             return {"ok": False, "error": "Job not found"}
+        if db_job.status != job.status:
+            return {"ok": False, "error": "Job status changed, please retry"}
 
         assign_stmt = select(JobAssignment).where(JobAssignment.id == assignment.id)
         assign_result = await db.execute(assign_stmt)
@@ -606,11 +619,11 @@ async def handle_mark_started(sid: str, data: dict[str, Any]) -> dict[str, Any]:
     now = datetime.now(timezone.utc)
 
     async with async_session_factory() as db:
-        job_stmt = select(Job).where(Job.id == uuid.UUID(job_id))
-        job_result = await db.execute(job_stmt)
-        db_job = job_result.scalar_one_or_none()
+        db_job = await _lock_job(db, job_id)
         if db_job is None:
             return {"ok": False, "error": "Job not found"}
+        if db_job.status != job.status:
+            return {"ok": False, "error": "Job status changed, please retry"}
 
         assign_stmt = select(JobAssignment).where(JobAssignment.id == assignment.id)
         assign_result = await db.execute(assign_stmt)
@@ -664,11 +677,11 @@ async def handle_mark_completed(sid: str, data: dict[str, Any]) -> dict[str, Any
     now = datetime.now(timezone.utc)
 
     async with async_session_factory() as db:
-        job_stmt = select(Job).where(Job.id == uuid.UUID(job_id))
-        job_result = await db.execute(job_stmt)
-        db_job = job_result.scalar_one_or_none()
+        db_job = await _lock_job(db, job_id)
         if db_job is None:
             return {"ok": False, "error": "Job not found"}
+        if db_job.status != job.status:
+            return {"ok": False, "error": "Job status changed, please retry"}
 
         assign_stmt = select(JobAssignment).where(JobAssignment.id == assignment.id)
         assign_result = await db.execute(assign_stmt)
@@ -31,6 +31,10 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import select
+
+from src.core.database import async_session_factory
+from src.models.job import Job
 from src.services.geoService import haversine_distance
 
 from ..locationTracker import (
@@ -61,6 +65,11 @@ _HISTORY_PREFIX: str = "visp:loc:history:"
 # Maximum number of history entries per job (prevents unbounded growth)
 _MAX_HISTORY_ENTRIES: int = 5000
 
+# Compact JSON separators for history snapshots.  Trails can hold
+# thousands of entries, so dropping the default ", " / ": " whitespace
+# noticeably cuts Redis memory and bytes transferred on reads.
+_HISTORY_JSON_SEPARATORS: tuple[str, str] = (",", ":")
+
 # Average driving speed for ETA estimation (km/h) when no route API is
 # available.  In production this should call the Maps integration.
 _AVG_SPEED_KMH: float = 30.0
@@ -216,23 +225,52 @@ async def _append_history(job_id: str, entry: dict[str, Any]) -> None:
     """Append a location snapshot to the job's history list in Redis."""
     redis = await get_redis()
     key = f"{_HISTORY_PREFIX}{job_id}"
-    await redis.rpush(key, json.dumps(entry))
+    await redis.rpush(key, json.dumps(entry, separators=_HISTORY_JSON_SEPARATORS))
     # Trim to prevent unbounded growth
     await redis.ltrim(key, -_MAX_HISTORY_ENTRIES, -1)
 
 
-async def get_location_history(job_id: str) -> list[dict[str, Any]]:
-    """Retrieve the full location history for a job (for audit/disputes).
+async def get_location_history(
+    job_id: str,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Retrieve the location history for a job (for audit/disputes).
+
+    Pagination is pushed down into ``LRANGE`` so only the requested slice
+    is transferred from Redis and JSON-decoded.
+
+    Args:
+        job_id: The job UUID string.
+        offset: Index of the first snapshot to return (0 = oldest).
+        limit: Maximum number of snapshots to return.  ``None`` returns
+            everything from ``offset`` to the end of the trail.
 
     Returns:
         List of location snapshot dicts in chronological order.
+
+    Raises:
+        ValueError: If ``offset`` or ``limit`` is negative.
     """
+    # LRANGE treats negative indices as counting from the tail, so they
+    # must never reach Redis.
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must be non-negative")
+    if limit == 0:
+        return []
     redis = await get_redis()
     key = f"{_HISTORY_PREFIX}{job_id}"
-    raw_entries = await redis.lrange(key, 0, -1)
+    stop = -1 if limit is None else offset + limit - 1
+    raw_entries = await redis.lrange(key, offset, stop)
     return [json.loads(entry) for entry in raw_entries]
 
 
+async def get_location_history_count(job_id: str) -> int:
+    """Return the number of snapshots stored for a job's location history."""
+    redis = await get_redis()
+    return await redis.llen(f"{_HISTORY_PREFIX}{job_id}")
+
+
 # ---------------------------------------------------------------------------
 # Inbound event handler
 # ---------------------------------------------------------------------------
@@ -394,19 +432,12 @@ async def _load_and_cache_destination_eta(
     This is called once per tracking session when the destination is not
     yet cached.
     """
-    import uuid as _uuid
-
-    from sqlalchemy import select as sa_select
-
-    from src.api.deps import async_session_factory
-    from src.models.job import Job
-
     try:
         async with async_session_factory() as db:
-            stmt = sa_select(
+            stmt = select(
                 Job.service_latitude,
                 Job.service_longitude,
-            ).where(Job.id == _uuid.UUID(job_id))
+            ).where(Job.id == UUID(job_id))
             result = await db.execute(stmt)
             row = result.one_or_none()
 
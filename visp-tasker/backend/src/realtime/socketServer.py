@@ -15,12 +15,14 @@ Architecture:
   - python-socketio AsyncServer mounted as ASGI middleware on FastAPI
   - Redis adapter for horizontal scaling across multiple ECS tasks
   - JWT authentication on connect, extracting user_id and role
-  - Room-based routing: job_{job_id}, provider_{user_id}, customer_{user_id}
+  - Room-based routing: job_{job_id}, provider_{user_id}, customer_{user_id},
+    and the role-agnostic user_{user_id} on the default namespace
 
 Connection lifecycle:
   1. Client connects with ``auth: { token: "<jwt>" }``
   2. Server validates JWT, extracts user_id and role
   3. Server joins the user to their personal room (provider_<id> or customer_<id>)
+     and, on the default namespace, to user_<id>
   4. Client explicitly joins job rooms via ``join_job`` event
   5. On disconnect, all room memberships and tracking sessions are cleaned up
 """
@@ -167,9 +169,11 @@ async def connect(sid: str, environ: dict[str, Any], auth: dict[str, Any] | None
 
     _register_connection(sid, user_id, {"role": role})
 
-    # Auto-join the user's personal room
+    # Auto-join the user's personal room, plus a role-agnostic room for
+    # services that know the user but not their role
     personal_room = f"{role}_{user_id}"
     await sio.enter_room(sid, personal_room)
+    await sio.enter_room(sid, f"user_{user_id}")
 
     logger.info(
         "Connected: sid=%s user_id=%s role=%s room=%s",
@@ -401,6 +405,23 @@ async def send_to_user(
         logger.debug("Sent %s to user=%s via %d sids ns=%s", event, user_id, len(sids), namespace)
 
 
+async def emit_to_user(user_id: str, event: str, data: dict[str, Any]) -> None:
+    """Send an event to every session of a user on the default namespace.
+
+    Targets the ``user_<user_id>`` room joined at connect time, so delivery
+    goes through the Redis adapter and reaches sessions on every worker
+    without knowing the user's role.
+
+    Args:
+        user_id: The user UUID string.
+        event: Socket.IO event name.
+        data: Event payload dict.
+    """
+    room = f"user_{user_id}"
+    await sio.emit(event, data, room=room)
+    logger.debug("Sent %s to room=%s", event, room)
+
+
 async def broadcast_emergency(data: dict[str, Any]) -> None:
     """Broadcast an emergency event to all connected Level 4 providers.
 
@@ -25,7 +25,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.chat import ChatMessage, MessageType
@@ -85,6 +85,23 @@ _SAFETY_PATTERN: re.Pattern = re.compile(
     re.IGNORECASE,
 )
 
+# The participant check runs for every chat request and socket event, so its
+# statements are built once with bind parameters; each call reuses the
+# statement object and its memoized compiled-cache key.
+_JOB_BY_ID_STMT = select(Job).where(Job.id == bindparam("job_id"))
+
+_ASSIGNED_PROVIDER_USER_IDS_STMT = (
+    select(ProviderProfile.user_id)
+    .join(JobAssignment, JobAssignment.provider_id == ProviderProfile.id)
+    .where(
+        JobAssignment.job_id == bindparam("job_id"),
+        JobAssignment.status.in_([
+            AssignmentStatus.ACCEPTED,
+            AssignmentStatus.COMPLETED,
+        ]),
+    )
+)
+
 
 # ---------------------------------------------------------------------------
 # Data transfer objects
@@ -167,8 +184,7 @@ async def _verify_participant(
         ChatNotAllowedError: If the job status does not permit chat.
         NotParticipantError: If the user is neither customer nor assigned provider.
     """
-    stmt = select(Job).where(Job.id == job_id)
-    result = await db.execute(stmt)
+    result = await db.execute(_JOB_BY_ID_STMT, {"job_id": job_id})
     job = result.scalar_one_or_none()
 
     if job is None:
@@ -184,25 +200,11 @@ async def _verify_participant(
         return job
 
     # Check if user is the assigned provider
-    assign_stmt = select(JobAssignment.provider_id).where(
-        JobAssignment.job_id == job_id,
-        JobAssignment.status.in_([
-            AssignmentStatus.ACCEPTED,
-            AssignmentStatus.COMPLETED,
-        ]),
+    assign_result = await db.execute(
+        _ASSIGNED_PROVIDER_USER_IDS_STMT, {"job_id": job_id}
     )
-    assign_result = await db.execute(assign_stmt)
-    provider_ids = [row.provider_id for row in assign_result.all()]
-
-    if provider_ids:
-        # Resolve provider_profile.user_id for each assignment
-        prov_stmt = select(ProviderProfile.user_id).where(
-            ProviderProfile.id.in_(provider_ids),
-        )
-        prov_result = await db.execute(prov_stmt)
-        provider_user_ids = {row.user_id for row in prov_result.all()}
-        if user_id in provider_user_ids:
-            return job
+    if user_id in {row.user_id for row in assign_result.all()}:
+        return job
 
     raise NotParticipantError("You are not a participant in this job")
 
@@ -12,6 +12,7 @@ SQLAlchemy sessions and enforce business rules including:
 
 Key functions:
   - create_job        -- create with SLA snapshot
+  - book_job          -- create + pending_match + price quote in one flush
   - update_job_status -- state machine transition
   - cancel_job        -- cancellation with actor enforcement
   - get_job           -- single job retrieval
@@ -21,6 +22,7 @@ Key functions:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import random
@@ -31,10 +33,14 @@ from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import Any, Optional, Sequence
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, lambda_stmt, or_, select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 
+from src.core.database import async_session_factory
+from src.core.pagination import decode_cursor, encode_cursor
 from src.events.jobEvents import (
     emit_job_cancelled,
     emit_job_completed,
@@ -42,10 +48,12 @@ from src.events.jobEvents import (
     emit_job_status_changed,
     emit_sla_snapshot_captured,
 )
-from src.models.job import Job, JobPriority, JobStatus
+from src.models.job import AssignmentStatus, Job, JobAssignment, JobPriority, JobStatus
+from src.models.provider import ProviderProfile
 from src.models.sla import SLAProfile
 from src.models.taxonomy import ServiceTask
 from src.services.jobStateManager import ActorType, validate_transition
+from src.services.pricingEngine import PriceEstimate, calculate_price
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +70,7 @@ class PaginatedResult:
     total_items: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
     @property
     def total_pages(self) -> int:
@@ -70,6 +79,18 @@ class PaginatedResult:
         return math.ceil(self.total_items / self.page_size)
 
 
+@dataclass(frozen=True)
+class BookingResult:
+    """A freshly booked job plus the price estimate used to quote it.
+
+    ``estimate`` is None when the pricing engine could not produce a quote;
+    the job is still booked in that case.
+    """
+
+    job: Job
+    estimate: PriceEstimate | None
+
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -98,6 +119,16 @@ class InvalidTransitionError(Exception):
         super().__init__(reason)
 
 
+class ConcurrentUpdateError(Exception):
+    """Raised when a job was changed by someone else since it was read."""
+
+    def __init__(self, job_id: uuid.UUID) -> None:
+        self.job_id = job_id
+        super().__init__(
+            f"Job '{job_id}' was modified concurrently; reload and retry."
+        )
+
+
 # ---------------------------------------------------------------------------
 # Reference number generation
 # ---------------------------------------------------------------------------
@@ -254,6 +285,37 @@ async def create_job(
     Raises:
         TaskNotFoundError: If the task_id does not exist in the catalog.
     """
+    job, task = await _prepare_job(
+        db,
+        customer_id=customer_id,
+        task_id=task_id,
+        location=location,
+        schedule=schedule,
+        priority=priority,
+        is_emergency=is_emergency,
+        customer_notes_json=customer_notes_json,
+    )
+
+    db.add(job)
+    await db.flush()
+
+    _announce_job_created(job, task)
+    return job
+
+
+async def _prepare_job(
+    db: AsyncSession,
+    *,
+    customer_id: uuid.UUID,
+    task_id: uuid.UUID,
+    location: dict[str, Any],
+    schedule: dict[str, Any] | None,
+    priority: str,
+    is_emergency: bool,
+    customer_notes_json: list[str] | None,
+) -> tuple[Job, ServiceTask]:
+    """Validate the task and build an unsaved DRAFT ``Job`` with its SLA
+    snapshot.  The caller adds and flushes it."""
     # 1. Validate task exists in the closed catalog
     task_stmt = select(ServiceTask).where(
         ServiceTask.id == task_id,
@@ -317,31 +379,185 @@ async def create_job(
         job.requested_time_end = schedule.get("requested_time_end")
         job.flexible_schedule = schedule.get("flexible_schedule", False)
 
-    db.add(job)
-    await db.flush()
+    return job, task
+
 
-    # 6. Emit events
+def _announce_job_created(job: Job, task: ServiceTask) -> None:
+    """Emit the creation events for a freshly inserted job."""
     emit_job_created(
         job_id=job.id,
-        customer_id=customer_id,
-        task_id=task_id,
-        reference_number=reference_number,
+        customer_id=job.customer_id,
+        task_id=job.task_id,
+        reference_number=job.reference_number,
     )
     emit_sla_snapshot_captured(
         job_id=job.id,
-        sla_profile_id=sla_profile_id,
-        snapshot=sla_snapshot,
+        sla_profile_id=job.sla_profile_id,
+        snapshot=job.sla_snapshot_json,
     )
 
     logger.info(
         "Job created: %s (ref=%s, task=%s, level=%s, emergency=%s)",
         job.id,
-        reference_number,
+        job.reference_number,
         task.slug,
         task.level.value,
-        is_emergency,
+        job.is_emergency,
     )
 
+
+def _commission_cents(price_cents: int, rate: Decimal) -> int:
+    """Commission on *price_cents* at *rate*, truncated to whole cents.
+
+    The rate is split into an exact integer ratio so the calculation stays
+    in integer arithmetic instead of round-tripping the price through Decimal.
+    """
+    numerator, denominator = rate.as_integer_ratio()
+    return price_cents * numerator // denominator
+
+
+async def _quote_price(
+    *,
+    task_id: uuid.UUID,
+    latitude: Decimal,
+    longitude: Decimal,
+    requested_date: date | None,
+    is_emergency: bool,
+    country: str,
+) -> PriceEstimate | None:
+    """Run the pricing engine on a dedicated session; None on failure."""
+    try:
+        async with async_session_factory() as pricing_db:
+            return await calculate_price(
+                pricing_db,
+                task_id=task_id,
+                latitude=latitude,
+                longitude=longitude,
+                requested_date=requested_date,
+                is_emergency=is_emergency,
+                country=country,
+            )
+    except Exception as exc:
+        # Includes pool timeouts: the quote holds a second connection, so
+        # under pool pressure it can fail while the booking itself succeeds.
+        logger.warning(
+            "Price estimation failed for task %s; booking unpriced: %s",
+            task_id,
+            exc,
+            exc_info=True,
+        )
+        return None
+
+
+async def book_job(
+    db: AsyncSession,
+    *,
+    customer_id: uuid.UUID,
+    task_id: uuid.UUID,
+    location: dict[str, Any],
+    schedule: dict[str, Any] | None = None,
+    priority: str = "standard",
+    is_emergency: bool = False,
+    customer_notes_json: list[str] | None = None,
+) -> BookingResult:
+    """Create a job, move it to PENDING_MATCH, and quote it in one pass.
+
+    This is the mobile booking path.  The status transition and price quote
+    are applied to the unsaved ``Job`` before it is added, so the whole
+    booking is written by a single INSERT with no follow-up UPDATE.  The
+    quote only depends on the request inputs, so it runs concurrently with
+    the task/SLA lookups on its own session.
+
+    Pricing is best-effort: if the pricing engine fails the job is still
+    booked and ``BookingResult.estimate`` is None.
+
+    Raises:
+        TaskNotFoundError: If the task_id does not exist in the catalog.
+    """
+    price_task = asyncio.create_task(
+        _quote_price(
+            task_id=task_id,
+            latitude=Decimal(str(location["latitude"])),
+            longitude=Decimal(str(location["longitude"])),
+            requested_date=schedule.get("requested_date") if schedule else None,
+            is_emergency=is_emergency,
+            country=location.get("country", "CA"),
+        )
+    )
+    try:
+        job, task = await _prepare_job(
+            db,
+            customer_id=customer_id,
+            task_id=task_id,
+            location=location,
+            schedule=schedule,
+            priority=priority,
+            is_emergency=is_emergency,
+            customer_notes_json=customer_notes_json,
+        )
+    except BaseException:
+        price_task.cancel()
+        raise
+
+    # DRAFT -> PENDING_MATCH to kick off matching (stay in DRAFT if refused)
+    old_status = job.status
+    transition_result = validate_transition(
+        old_status, JobStatus.PENDING_MATCH, ActorType.SYSTEM
+    )
+    if transition_result.allowed:
+        job.status = JobStatus.PENDING_MATCH
+
+    estimate = await price_task
+    if estimate is not None:
+        job.quoted_price_cents = estimate.final_price_min_cents
+        job.commission_rate = estimate.commission_rate_default
+        job.commission_amount_cents = _commission_cents(
+            estimate.final_price_min_cents, estimate.commission_rate_default
+        )
+        job.provider_payout_cents = (
+            estimate.final_price_min_cents - job.commission_amount_cents
+        )
+
+    db.add(job)
+    await db.flush()
+
+    _announce_job_created(job, task)
+    if job.status != old_status:
+        emit_job_status_changed(
+            job_id=job.id,
+            old_status=old_status.value,
+            new_status=job.status.value,
+            actor_id=None,
+        )
+
+    return BookingResult(job=job, estimate=estimate)
+
+
+# PostgreSQL SQLSTATE for "lock_not_available" (raised by FOR UPDATE NOWAIT).
+_LOCK_NOT_AVAILABLE = "55P03"
+
+
+async def _lock_job_for_update(db: AsyncSession, job_id: uuid.UUID) -> Job:
+    """Load a job with ``SELECT ... FOR UPDATE NOWAIT``.
+
+    The row lock is held until the request's transaction ends, so two status
+    changes on the same job are serialised.  A second writer does not queue
+    behind the first: it fails immediately with ConcurrentUpdateError.
+
+    Raises:
+        JobNotFoundError: If the job does not exist.
+        ConcurrentUpdateError: If another transaction holds the row lock.
+    """
+    stmt = select(Job).where(Job.id == job_id).with_for_update(nowait=True)
+    try:
+        job = (await db.execute(stmt)).scalar_one_or_none()
+    except DBAPIError as exc:
+        if getattr(exc.orig, "sqlstate", None) == _LOCK_NOT_AVAILABLE:
+            raise ConcurrentUpdateError(job_id) from exc
+        raise
+
+    if job is None:
+        raise JobNotFoundError(job_id)
     return job
 
 
@@ -371,13 +587,9 @@ async def update_job_status(
     Raises:
         JobNotFoundError: If the job does not exist.
         InvalidTransitionError: If the transition is not allowed.
+        ConcurrentUpdateError: If the job changed since it was read.
     """
-    stmt = select(Job).where(Job.id == job_id)
-    result = await db.execute(stmt)
-    job = result.scalar_one_or_none()
-
-    if job is None:
-        raise JobNotFoundError(job_id)
+    job = await _lock_job_for_update(db, job_id)
 
     old_status = job.status
     target_status = JobStatus(new_status)
@@ -398,7 +610,10 @@ async def update_job_status(
     elif target_status == JobStatus.COMPLETED:
         job.completed_at = now
 
-    await db.flush()
+    try:
+        await db.flush()
+    except StaleDataError as exc:
+        raise ConcurrentUpdateError(job_id) from exc
 
     # Emit status change event
     emit_job_status_changed(
@@ -452,6 +667,7 @@ async def cancel_job(
     Raises:
         JobNotFoundError: If the job does not exist.
         InvalidTransitionError: If cancellation is not allowed.
+        ConcurrentUpdateError: If the job changed since it was read.
     """
     # Determine target cancellation status
     cancel_status_map = {
@@ -462,12 +678,7 @@ async def cancel_job(
     }
     target_status = cancel_status_map.get(actor_type, JobStatus.CANCELLED_BY_SYSTEM)
 
-    stmt = select(Job).where(Job.id == job_id)
-    result = await db.execute(stmt)
-    job = result.scalar_one_or_none()
-
-    if job is None:
-        raise JobNotFoundError(job_id)
+    job = await _lock_job_for_update(db, job_id)
 
     old_status = job.status
     actor = ActorType(actor_type)
@@ -482,7 +693,10 @@ async def cancel_job(
     job.cancelled_at = datetime.now(timezone.utc)
     job.cancellation_reason = reason
 
-    await db.flush()
+    try:
+        await db.flush()
+    except StaleDataError as exc:
+        raise ConcurrentUpdateError(job_id) from exc
 
     # Emit events
     emit_job_status_changed(
@@ -512,20 +726,98 @@ async def cancel_job(
 async def get_job(
     db: AsyncSession,
     job_id: uuid.UUID,
+    *,
+    include_providers: bool = False,
 ) -> Job | None:
     """Fetch a single job by primary key with assignments eagerly loaded.
 
+    When ``include_providers`` is True each assignment's provider profile
+    and that provider's user are loaded in the same call (one IN-batched
+    SELECT per level), so callers can read ``assignment.provider.user``
+    without issuing further queries.  Every other relationship on the job
+    is ``raiseload`` in that mode, so an unplanned lazy load raises rather
+    than adding a round-trip.
+
     Returns None if the job is not found.
     """
-    stmt = (
-        select(Job)
-        .options(selectinload(Job.assignments))
-        .where(Job.id == job_id)
-    )
+    # lambda_stmt caches statement construction across calls; only job_id
+    # is re-bound per request.
+    stmt = lambda_stmt(lambda: select(Job).where(Job.id == job_id))
+    if include_providers:
+        stmt += lambda s: s.options(
+            selectinload(Job.assignments)
+            .selectinload(JobAssignment.provider)
+            .selectinload(ProviderProfile.user),
+            raiseload("*"),
+        )
+    else:
+        stmt += lambda s: s.options(selectinload(Job.assignments))
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+async def _paginate_jobs(
+    db: AsyncSession,
+    filters: list[Any],
+    *,
+    page: int,
+    page_size: int,
+    cursor: str | None = None,
+) -> PaginatedResult:
+    """Fetch one page of jobs (newest first) and the total match count.
+
+    The total is computed in the same round-trip with ``COUNT(*) OVER ()``.
+    Only a page past the end (no rows to carry the window value) falls
+    back to a separate COUNT query.
+
+    When ``cursor`` is given, the page is located by keyset on
+    ``(created_at, id)`` instead of OFFSET, so deep pages cost the same as
+    the first one.  In that mode ``total_items`` counts the jobs from the
+    cursor onwards.  Every page that has a successor carries a
+    ``next_cursor``.
+    """
+    data_stmt = (
+        select(Job, func.count().over().label("total_items"))
+        .where(*filters)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(page_size)
+    )
+    if cursor is not None:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        data_stmt = data_stmt.where(
+            or_(
+                Job.created_at < cursor_created_at,
+                and_(Job.created_at == cursor_created_at, Job.id < cursor_id),
+            )
+        )
+        skipped = 0
+    else:
+        skipped = (page - 1) * page_size
+        data_stmt = data_stmt.offset(skipped)
+    rows = (await db.execute(data_stmt)).all()
+
+    if rows:
+        total_items: int = rows[0].total_items
+    elif page > 1 and cursor is None:
+        count_stmt = select(func.count(Job.id)).where(*filters)
+        total_items = (await db.execute(count_stmt)).scalar_one()
+    else:
+        total_items = 0
+
+    items = [row[0] for row in rows]
+    next_cursor = None
+    if items and skipped + len(items) < total_items:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+    return PaginatedResult(
+        items=items,
+        total_items=total_items,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
+
+
 async def get_jobs_by_customer(
     db: AsyncSession,
     customer_id: uuid.UUID,
@@ -533,34 +825,19 @@ async def get_jobs_by_customer(
     status_filter: str | None = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
 ) -> PaginatedResult:
     """Return a paginated list of jobs for a specific customer.
 
-    Optionally filtered by status.
+    Optionally filtered by status.  Pass ``cursor`` (from a previous page's
+    ``next_cursor``) for keyset pagination instead of ``page``.
     """
     filters = [Job.customer_id == customer_id]
     if status_filter:
         filters.append(Job.status == JobStatus(status_filter))
 
-    # Count
-    count_stmt = select(func.count(Job.id)).where(*filters)
-    total_items: int = (await db.execute(count_stmt)).scalar_one()
-
-    # Data
-    data_stmt = (
-        select(Job)
-        .where(*filters)
-        .order_by(Job.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    jobs = (await db.execute(data_stmt)).scalars().all()
-
-    return PaginatedResult(
-        items=jobs,
-        total_items=total_items,
-        page=page,
-        page_size=page_size,
+    return await _paginate_jobs(
+        db, filters, page=page, page_size=page_size, cursor=cursor
     )
 
 
@@ -571,14 +848,15 @@ async def get_jobs_by_provider(
     status_filter: str | None = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
 ) -> PaginatedResult:
     """Return a paginated list of jobs assigned to a specific provider.
 
     Joins through job_assignments to find jobs where the provider has
-    an active (non-declined/expired) assignment.
+    an active (non-declined/expired) assignment.  Pass ``cursor`` (from a
+    previous page's ``next_cursor``) for keyset pagination instead of
+    ``page``.
     """
-    from src.models.job import AssignmentStatus, JobAssignment
-
     # Subquery: job IDs assigned to this provider
     assignment_subq = (
         select(JobAssignment.job_id)
@@ -596,23 +874,6 @@ async def get_jobs_by_provider(
     if status_filter:
         filters.append(Job.status == JobStatus(status_filter))
 
-    # Count
-    count_stmt = select(func.count(Job.id)).where(*filters)
-    total_items: int = (await db.execute(count_stmt)).scalar_one()
-
-    # Data
-    data_stmt = (
-        select(Job)
-        .where(*filters)
-        .order_by(Job.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    jobs = (await db.execute(data_stmt)).scalars().all()
-
-    return PaginatedResult(
-        items=jobs,
-        total_items=total_items,
-        page=page,
-        page_size=page_size,
+    return await _paginate_jobs(
+        db, filters, page=page, page_size=page_size, cursor=cursor
     )
@@ -28,9 +28,10 @@ Key functions:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Optional
 
@@ -92,6 +93,12 @@ LEVEL_NUMERIC: dict[ProviderLevel, int] = {
     ProviderLevel.LEVEL_4: 4,
 }
 
+# Candidate count above which the haversine radius filter runs in a worker
+# thread.  It scans every active provider, so on a large pool it would
+# otherwise hold the event loop; below this the thread hop costs more than
+# the scan.
+GEO_FILTER_OFFLOAD_THRESHOLD: int = 500
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -334,8 +341,14 @@ async def find_matching_providers(
 
     total_evaluated = len(all_providers)
 
-    # 3. Filter by geographic radius
-    nearby = filter_by_radius(all_providers, job_lat, job_lon, radius_km)
+    # 3. Filter by geographic radius (off the event loop for large pools;
+    #    the profiles are fully loaded, so the worker never touches the DB)
+    if total_evaluated >= GEO_FILTER_OFFLOAD_THRESHOLD:
+        nearby = await asyncio.to_thread(
+            filter_by_radius, all_providers, job_lat, job_lon, radius_km
+        )
+    else:
+        nearby = filter_by_radius(all_providers, job_lat, job_lon, radius_km)
 
     # 4. Apply hard qualification filters
     qualified: list[dict[str, Any]] = []
@@ -447,17 +460,14 @@ async def assign_provider(
         ProviderNotFoundError: If the provider does not exist.
         AssignmentError: If the job already has an active assignment.
     """
-    # Validate job exists
-    job_stmt = select(Job).where(Job.id == job_id)
-    job_result = await db.execute(job_stmt)
-    job = job_result.scalar_one_or_none()
+    # Validate job and provider exist.  Session.get() is served from the
+    # identity map when the caller has already loaded them (as the matching
+    # path has), so this costs no round trips in the common case.
+    job = await db.get(Job, job_id)
     if job is None:
         raise JobNotFoundError(job_id)
 
-    # Validate provider exists
-    prov_stmt = select(ProviderProfile).where(ProviderProfile.id == provider_id)
-    prov_result = await db.execute(prov_stmt)
-    provider = prov_result.scalar_one_or_none()
+    provider = await db.get(ProviderProfile, provider_id)
     if provider is None:
         raise ProviderNotFoundError(provider_id)
 
@@ -483,13 +493,10 @@ async def assign_provider(
     sla_completion_deadline = None
 
     if job.sla_response_time_min:
-        from datetime import timedelta
         sla_response_deadline = now + timedelta(minutes=job.sla_response_time_min)
     if job.sla_arrival_time_min:
-        from datetime import timedelta
         sla_arrival_deadline = now + timedelta(minutes=job.sla_arrival_time_min)
     if job.sla_completion_time_min:
-        from datetime import timedelta
         sla_completion_deadline = now + timedelta(minutes=job.sla_completion_time_min)
 
     # Create the assignment
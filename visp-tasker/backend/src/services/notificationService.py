@@ -20,13 +20,17 @@ delivered with the critical alert sound.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update
+from redis.asyncio import Redis
+from sqlalchemy import bindparam, event, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from src.core.database import async_session_factory
 from src.integrations.fcm import pushService
 from src.models.job import Job
 from src.models.notification import (
@@ -35,9 +39,61 @@ from src.models.notification import (
     NotificationPreference,
     NotificationType,
 )
+from src.realtime.socketServer import emit_to_user, get_redis
 
 logger = logging.getLogger(__name__)
 
+# Unread badge counts are pushed to connected clients as UNREAD_COUNT_EVENT
+# whenever they change, so the REST count is only needed to sync on app
+# start or reconnect.  That count is cached in Redis and dropped whenever a
+# notification is stored or marked read.  Both the cache update and the push
+# wait for the writing transaction to commit (unread_count_changed_on_commit),
+# so clients never see a change that rolls back.
+#
+# Each change also bumps a per-user generation counter, and a counted value
+# is only cached if the generation is still the one read before the COUNT
+# started.  A count whose snapshot predates a commit therefore cannot
+# overwrite the post-commit invalidation with the old value.
+UNREAD_COUNT_EVENT: str = "notification:unread_count"
+_UNREAD_COUNT_CACHE_PREFIX: str = "visp:notifications:unread:"
+_UNREAD_COUNT_CACHE_TTL_SECONDS: int = 60
+_UNREAD_GENERATION_PREFIX: str = "visp:notifications:unread-gen:"
+# Outlives any in-flight COUNT by a wide margin; an idle user's counter may
+# expire and restart from zero.
+_UNREAD_GENERATION_TTL_SECONDS: int = 3600
+
+# Caches ARGV[2] under KEYS[1] for ARGV[3] seconds only if the generation
+# at KEYS[2] still equals ARGV[1] (a missing counter reads as "0").
+_CACHE_UNREAD_COUNT_IF_CURRENT_LUA: str = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Unread-count changes recorded on a session, applied once it commits.
+_PENDING_UNREAD_CHANGES_KEY: str = "visp_pending_unread_count_changes"
+
+# Post-commit pushes run as tasks; references are held until they finish.
+_unread_change_tasks: set[asyncio.Task[None]] = set()
+
+# In-flight unread counts keyed by user, so a burst of polls that all miss
+# the cache waits on one query.  Entries are removed as soon as the count
+# finishes.
+_unread_count_inflight: dict[uuid.UUID, asyncio.Task[int]] = {}
+
+# Built once with a bind parameter so the polled count reuses its compiled
+# form instead of rebuilding the select on every cache miss.
+_UNREAD_COUNT_STMT = (
+    select(func.count())
+    .select_from(Notification)
+    .where(
+        Notification.user_id == bindparam("user_id"),
+        Notification.read.is_(False),
+    )
+)
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -173,6 +229,7 @@ async def _store_notification(
     )
     db.add(notification)
     await db.flush()
+    unread_count_changed_on_commit(db, user_id, delta=1)
     return notification
 
 
@@ -940,3 +997,167 @@ async def notify_payout_sent(
         sound="default",
         priority="normal",
     )
+
+
+# ---------------------------------------------------------------------------
+# Public API -- Unread counts
+# ---------------------------------------------------------------------------
+
+async def _count_unread(
+    user_id: uuid.UUID, redis: Redis | None, generation: str
+) -> int:
+    """Count a user's unread notifications on a dedicated session and cache it.
+
+    Runs as the shared task behind ``get_unread_count``'s single-flight, so
+    it must not borrow any one request's session.  The count is cached only
+    if the user's generation is still *generation*, read before the COUNT.
+    """
+    async with async_session_factory() as db:
+        result = await db.execute(_UNREAD_COUNT_STMT, {"user_id": user_id})
+        count = result.scalar_one()
+
+    if redis is not None:
+        try:
+            await redis.eval(
+                _CACHE_UNREAD_COUNT_IF_CURRENT_LUA,
+                2,
+                f"{_UNREAD_COUNT_CACHE_PREFIX}{user_id}",
+                f"{_UNREAD_GENERATION_PREFIX}{user_id}",
+                generation,
+                count,
+                _UNREAD_COUNT_CACHE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Unread count cache write failed for user %s: %s", user_id, exc)
+    return count
+
+
+async def get_unread_count(user_id: uuid.UUID) -> int:
+    """Return the number of unread notifications for a user.
+
+    Read through a short-TTL Redis cache; Redis failures fall back to the
+    SQL count.  Concurrent cache misses for the same user in this process
+    share a single COUNT query instead of each issuing their own.
+
+    Args:
+        user_id: The UUID of the user.
+
+    Returns:
+        The unread notification count.
+    """
+    try:
+        redis = await get_redis()
+        cached, generation = await redis.mget(
+            f"{_UNREAD_COUNT_CACHE_PREFIX}{user_id}",
+            f"{_UNREAD_GENERATION_PREFIX}{user_id}",
+        )
+    except Exception as exc:
+        logger.warning("Unread count cache read failed for user %s: %s", user_id, exc)
+        redis = cached = generation = None
+    if cached is not None:
+        return int(cached)
+
+    task = _unread_count_inflight.get(user_id)
+    if task is None:
+        task = asyncio.create_task(
+            _count_unread(user_id, redis, generation or "0")
+        )
+        _unread_count_inflight[user_id] = task
+        task.add_done_callback(lambda _: _unread_count_inflight.pop(user_id, None))
+    # Shielded so one cancelled caller does not cancel the count for the
+    # others waiting on it.
+    return await asyncio.shield(task)
+
+
+async def unread_count_changed(
+    user_id: uuid.UUID,
+    *,
+    delta: int | None = None,
+    unread_count: int | None = None,
+) -> None:
+    """Record a change to a user's unread count.
+
+    Bumps the user's cache generation, so a COUNT already in flight cannot
+    cache its older result, and caches an absolute ``unread_count`` or, for
+    a ``delta``, drops the cached count so the next read recounts it.  Then
+    pushes the change to the user's connected sessions as
+    ``UNREAD_COUNT_EVENT``: either a relative ``delta`` (notifications
+    stored or read) or an absolute ``unread_count`` known to be current.
+    Failures are logged and swallowed; the TTL expires any entry
+    that could not be dropped, and clients resync from the REST count on
+    reconnect.
+
+    Args:
+        user_id: The UUID of the user.
+        delta: Change to the unread count, e.g. 1, -1 or -n for read-all.
+        unread_count: New absolute unread count.
+    """
+    cache_key = f"{_UNREAD_COUNT_CACHE_PREFIX}{user_id}"
+    generation_key = f"{_UNREAD_GENERATION_PREFIX}{user_id}"
+    try:
+        redis = await get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, _UNREAD_GENERATION_TTL_SECONDS)
+            if unread_count is not None:
+                pipe.set(cache_key, unread_count, ex=_UNREAD_COUNT_CACHE_TTL_SECONDS)
+            else:
+                pipe.delete(cache_key)
+            await pipe.execute()
+    except Exception as exc:
+        logger.warning("Unread count cache invalidation failed for user %s: %s", user_id, exc)
+
+    payload: dict[str, int | str] = {"user_id": str(user_id)}
+    if delta is not None:
+        payload["delta"] = delta
+    if unread_count is not None:
+        payload["unread_count"] = unread_count
+    try:
+        await emit_to_user(str(user_id), UNREAD_COUNT_EVENT, payload)
+    except Exception as exc:
+        logger.warning("Unread count push failed for user %s: %s", user_id, exc)
+
+
+def unread_count_changed_on_commit(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    *,
+    delta: int | None = None,
+    unread_count: int | None = None,
+) -> None:
+    """Run ``unread_count_changed`` once *db*'s transaction commits.
+
+    Changes are dropped if the transaction rolls back.  Use this instead of
+    calling ``unread_count_changed`` directly whenever the change is made
+    in a transaction that has not committed yet.
+
+    Args:
+        db: The session holding the uncommitted change.
+        user_id: The UUID of the user.
+        delta: Change to the unread count, e.g. 1, -1 or -n for read-all.
+        unread_count: New absolute unread count.
+    """
+    db.info.setdefault(_PENDING_UNREAD_CHANGES_KEY, []).append(
+        (user_id, delta, unread_count)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_unread_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_UNREAD_CHANGES_KEY, None)
+    if not pending:
+        return
+    # Commit runs inside the async session's greenlet on the event loop
+    # thread, so the pushes are scheduled there rather than awaited.
+    loop = asyncio.get_running_loop()
+    for user_id, delta, unread_count in pending:
+        task = loop.create_task(
+            unread_count_changed(user_id, delta=delta, unread_count=unread_count)
+        )
+        _unread_change_tasks.add(task)
+        task.add_done_callback(_unread_change_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_unread_changes(session: Session) -> None:
+    session.info.pop(_PENDING_UNREAD_CHANGES_KEY, None)
@@ -28,7 +28,7 @@ from datetime import date, datetime, time, timezone
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Any, Optional, Sequence
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import (
@@ -105,6 +105,55 @@ DEFAULT_COMMISSION: dict[ProviderLevel, dict[str, Decimal]] = {
 }
 
 
+# The breakdown reads only the job and task columns it renders, in one
+# outer-joined row, followed by the latest pricing event's figures.
+_BREAKDOWN_JOB_STMT = (
+    select(
+        Job.task_id,
+        Job.is_emergency,
+        Job.currency,
+        Job.created_at,
+        Job.quoted_price_cents,
+        Job.final_price_cents,
+        Job.commission_rate,
+        Job.commission_amount_cents,
+        Job.provider_payout_cents,
+        ServiceTask.name.label("task_name"),
+        ServiceTask.level.label("task_level"),
+    )
+    .outerjoin(ServiceTask, ServiceTask.id == Job.task_id)
+    .where(Job.id == bindparam("job_id"))
+)
+
+_LATEST_PRICING_EVENT_STMT = (
+    select(
+        PricingEvent.base_price_cents,
+        PricingEvent.multiplier_applied,
+        PricingEvent.adjustments_cents,
+        PricingEvent.final_price_cents,
+        PricingEvent.commission_rate,
+        PricingEvent.commission_cents,
+        PricingEvent.provider_payout_cents,
+        PricingEvent.rules_applied_json,
+        PricingEvent.created_at,
+    )
+    .where(PricingEvent.job_id == bindparam("job_id"))
+    .order_by(PricingEvent.created_at.desc())
+    .limit(1)
+)
+
+# Version markers for a job's breakdown: the job row's updated_at and its
+# latest pricing event (events are append-only).  Lets the breakdown route
+# answer If-None-Match without rebuilding the breakdown.
+_BREAKDOWN_VERSION_STMT = select(
+    Job.updated_at,
+    select(func.max(PricingEvent.created_at))
+    .where(PricingEvent.job_id == Job.id)
+    .correlate(Job)
+    .scalar_subquery(),
+).where(Job.id == bindparam("job_id"))
+
+
 # ---------------------------------------------------------------------------
 # Response DTOs
 # ---------------------------------------------------------------------------
@@ -353,18 +402,18 @@ async def get_price_breakdown(
     Raises:
         ValueError: If job not found or no pricing events exist for the job.
     """
-    job = await _get_job(db, job_id)
-    task = await _get_service_task(db, job.task_id)
+    job = (
+        await db.execute(_BREAKDOWN_JOB_STMT, {"job_id": job_id})
+    ).one_or_none()
+    if job is None:
+        raise ValueError(f"Job not found: {job_id}")
+    if job.task_name is None:
+        raise ValueError(f"Service task not found: {job.task_id}")
 
     # Get the most recent pricing event for this job
-    stmt = (
-        select(PricingEvent)
-        .where(PricingEvent.job_id == job_id)
-        .order_by(PricingEvent.created_at.desc())
-        .limit(1)
-    )
-    result = await db.execute(stmt)
-    pricing_event = result.scalar_one_or_none()
+    pricing_event = (
+        await db.execute(_LATEST_PRICING_EVENT_STMT, {"job_id": job_id})
+    ).one_or_none()
 
     if pricing_event is None:
         # No pricing event yet -- calculate from job fields
@@ -411,8 +460,8 @@ async def get_price_breakdown(
     return PriceBreakdown(
         job_id=job_id,
         task_id=job.task_id,
-        task_name=task.name,
-        level=task.level.value,
+        task_name=job.task_name,
+        level=job.task_level.value,
         is_emergency=job.is_emergency,
         base_price_cents=base_price,
         dynamic_multiplier=dynamic_multiplier,
@@ -428,6 +477,21 @@ async def get_price_breakdown(
     )
 
 
+async def get_price_breakdown_version(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+) -> Optional[tuple[datetime, Optional[datetime]]]:
+    """Return ``(job.updated_at, latest pricing event time)`` for *job_id*.
+
+    Any change to the breakdown moves one of the two markers.  Returns
+    None if the job does not exist.
+    """
+    row = (
+        await db.execute(_BREAKDOWN_VERSION_STMT, {"job_id": job_id})
+    ).one_or_none()
+    return None if row is None else tuple(row)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -480,19 +544,6 @@ async def _get_service_task(
     return task
 
 
-async def _get_job(
-    db: AsyncSession,
-    job_id: uuid.UUID,
-) -> Job:
-    """Fetch a job by ID or raise ValueError."""
-    stmt = select(Job).where(Job.id == job_id)
-    result = await db.execute(stmt)
-    job = result.scalar_one_or_none()
-    if job is None:
-        raise ValueError(f"Job not found: {job_id}")
-    return job
-
-
 async def _get_active_pricing_rules(
     db: AsyncSession,
     task_id: uuid.UUID,
@@ -15,11 +15,11 @@ import math
 import uuid
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Optional, Sequence
+from typing import Any, NoReturn, Optional, Sequence
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from src.models.job import (
     AssignmentStatus,
@@ -34,16 +34,65 @@ from src.models.provider import (
 )
 from src.models.review import Review, ReviewerRole, ReviewStatus
 from src.models.sla import OnCallShift
-from src.models.taxonomy import ServiceCategory, ServiceTask
 from src.models.user import User
 from src.models.verification import (
     ProviderCredential,
     ProviderInsurancePolicy,
 )
+from src.realtime.locationTracker import get_provider_location
+from src.realtime.socketServer import get_redis
+from src.services import taxonomyCache
 from src.services.geoService import haversine_distance
 
 logger = logging.getLogger(__name__)
 
+# Average published rating per reviewee user.  Ratings move slowly, so the
+# aggregate is cached briefly; an empty string records "no reviews yet".
+_AVG_RATING_CACHE_PREFIX: str = "visp:provider:avg_rating:"
+_AVG_RATING_CACHE_TTL_SECONDS: int = 30
+
+# Per-request lookups built once with bind parameters, so each call reuses
+# the statement object and its memoized compiled-cache key instead of
+# constructing and keying a fresh select().
+_PROFILE_BY_USER_STMT = (
+    select(ProviderProfile)
+    .options(selectinload(ProviderProfile.user))
+    .where(ProviderProfile.user_id == bindparam("user_id"))
+)
+
+_PROFILE_WITH_USER_STMT = (
+    select(ProviderProfile)
+    .options(selectinload(ProviderProfile.user))
+    .where(ProviderProfile.id == bindparam("provider_id"))
+)
+
+# Tracking is polled, so it reads only the columns it renders: the job's
+# status and location plus the active assignment's provider and ETA, in
+# one outer-joined row.  The row versions give the payload a stable
+# updated_at when there is no live GPS fix.
+_TRACKING_ROW_STMT = (
+    select(
+        Job.status,
+        Job.service_latitude,
+        Job.service_longitude,
+        Job.updated_at.label("job_updated_at"),
+        JobAssignment.provider_id,
+        JobAssignment.estimated_arrival_min,
+        JobAssignment.updated_at.label("assignment_updated_at"),
+    )
+    .outerjoin(
+        JobAssignment,
+        and_(
+            JobAssignment.job_id == Job.id,
+            JobAssignment.status.in_([
+                AssignmentStatus.ACCEPTED,
+                AssignmentStatus.COMPLETED,
+            ]),
+        ),
+    )
+    .where(Job.id == bindparam("job_id"))
+)
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -83,18 +132,56 @@ async def get_provider_profile(
     user_id: uuid.UUID,
 ) -> ProviderProfile:
     """Fetch the provider profile for a user, raising if not found."""
-    stmt = (
-        select(ProviderProfile)
-        .options(selectinload(ProviderProfile.user))
-        .where(ProviderProfile.user_id == user_id)
-    )
-    result = await db.execute(stmt)
+    result = await db.execute(_PROFILE_BY_USER_STMT, {"user_id": user_id})
     profile = result.scalar_one_or_none()
     if profile is None:
         raise ProviderNotFoundError(user_id)
     return profile
 
 
+# ---------------------------------------------------------------------------
+# Ratings
+# ---------------------------------------------------------------------------
+
+async def get_avg_rating(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+) -> Optional[Decimal]:
+    """Average published rating received by a user, rounded to 2 places.
+
+    Read through a short-TTL Redis cache; Redis failures fall back to the
+    SQL aggregate.  Returns None when the user has no published reviews.
+    """
+    cache_key = f"{_AVG_RATING_CACHE_PREFIX}{user_id}"
+    try:
+        redis = await get_redis()
+        cached = await redis.get(cache_key)
+    except Exception as exc:
+        logger.warning("Rating cache read failed for user %s: %s", user_id, exc)
+        redis = cached = None
+    if cached is not None:
+        return Decimal(cached) if cached else None
+
+    rating_stmt = select(func.avg(Review.overall_rating)).where(
+        Review.reviewee_id == user_id,
+        Review.status == ReviewStatus.PUBLISHED,
+    )
+    # AVG over a NUMERIC column already comes back as a Decimal.
+    avg_rating = (await db.execute(rating_stmt)).scalar_one()
+    rating = round(avg_rating, 2) if avg_rating is not None else None
+
+    if redis is not None:
+        try:
+            await redis.set(
+                cache_key,
+                "" if rating is None else str(rating),
+                ex=_AVG_RATING_CACHE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Rating cache write failed for user %s: %s", user_id, exc)
+    return rating
+
+
 # ---------------------------------------------------------------------------
 # Dashboard
 # ---------------------------------------------------------------------------
@@ -157,13 +244,7 @@ async def get_dashboard(
 
     rating = None
     if profile is not None:
-        rating_stmt = select(func.avg(Review.overall_rating)).where(
-            Review.reviewee_id == profile.user_id,
-            Review.status == ReviewStatus.PUBLISHED,
-        )
-        avg_rating = (await db.execute(rating_stmt)).scalar_one()
-        if avg_rating is not None:
-            rating = round(Decimal(str(avg_rating)), 2)
+        rating = await get_avg_rating(db, profile.user_id)
 
     # Active job (currently in progress or en route)
     active_job_stmt = (
@@ -255,6 +336,16 @@ async def get_dashboard(
 # Offers
 # ---------------------------------------------------------------------------
 
+def _estimated_payout_cents(price_cents: int, commission_rate: Decimal) -> int:
+    """Provider payout on *price_cents* after truncated commission.
+
+    Exact integer arithmetic on the rate's integer ratio, so the figure
+    matches the payout jobService stores at booking to the cent.
+    """
+    numerator, denominator = commission_rate.as_integer_ratio()
+    return price_cents - price_cents * numerator // denominator
+
+
 async def get_pending_offers(
     db: AsyncSession,
     provider_id: uuid.UUID,
@@ -264,55 +355,50 @@ async def get_pending_offers(
     Returns a list of enriched offer dicts with job, task, customer,
     pricing, SLA, and distance information.
     """
-    # Fetch assignments with status OFFERED for this provider
+    # One statement for every offer: the assignment, its job, the customer
+    # and the customer's average published rating (correlated subquery),
+    # instead of a customer SELECT and a rating SELECT per offer.
+    customer_avg = (
+        select(func.avg(Review.overall_rating))
+        .where(
+            Review.reviewee_id == Job.customer_id,
+            Review.status == ReviewStatus.PUBLISHED,
+        )
+        .correlate(Job)
+        .scalar_subquery()
+        .label("customer_rating")
+    )
     stmt = (
-        select(JobAssignment)
+        select(JobAssignment, Job, User, customer_avg)
+        .join(Job, Job.id == JobAssignment.job_id)
+        .outerjoin(User, User.id == Job.customer_id)
         .where(
             JobAssignment.provider_id == provider_id,
             JobAssignment.status == AssignmentStatus.OFFERED,
         )
         .order_by(JobAssignment.offered_at.desc())
     )
-    result = await db.execute(stmt)
-    assignments = result.scalars().all()
+    rows = (await db.execute(stmt)).all()
 
-    if not assignments:
+    if not rows:
         return []
 
     # Get provider location for distance calculation
     provider_stmt = select(ProviderProfile).where(ProviderProfile.id == provider_id)
     provider = (await db.execute(provider_stmt)).scalar_one_or_none()
 
-    offers: list[dict[str, Any]] = []
-    for assignment in assignments:
-        # Load job
-        job_stmt = select(Job).where(Job.id == assignment.job_id)
-        job = (await db.execute(job_stmt)).scalar_one_or_none()
-        if job is None:
-            continue
-
-        # Load task with category
-        task_stmt = (
-            select(ServiceTask)
-            .options(selectinload(ServiceTask.category))
-            .where(ServiceTask.id == job.task_id)
-        )
-        task = (await db.execute(task_stmt)).scalar_one_or_none()
+    # Task summaries for the offered jobs (Redis-cached)
+    task_summaries = await taxonomyCache.get_task_summaries(
+        db, (job.task_id for _, job, _, _ in rows)
+    )
 
-        # Load customer
-        customer_stmt = select(User).where(User.id == job.customer_id)
-        customer = (await db.execute(customer_stmt)).scalar_one_or_none()
+    offers: list[dict[str, Any]] = []
+    for assignment, job, customer, avg in rows:
+        task = task_summaries.get(job.task_id)
 
-        # Customer rating
         customer_rating = None
-        if customer:
-            rating_stmt = select(func.avg(Review.overall_rating)).where(
-                Review.reviewee_id == customer.id,
-                Review.status == ReviewStatus.PUBLISHED,
-            )
-            avg = (await db.execute(rating_stmt)).scalar_one()
-            if avg is not None:
-                customer_rating = round(Decimal(str(avg)), 2)
+        if customer is not None and avg is not None:
+            customer_rating = round(avg, 2)
 
         # Distance
         distance_km = None
@@ -334,8 +420,8 @@ async def get_pending_offers(
         # Estimated payout
         estimated_payout = None
         if job.quoted_price_cents and job.commission_rate:
-            estimated_payout = int(
-                job.quoted_price_cents * (1 - float(job.commission_rate))
+            estimated_payout = _estimated_payout_cents(
+                job.quoted_price_cents, job.commission_rate
             )
 
         offers.append({
@@ -350,13 +436,11 @@ async def get_pending_offers(
             "service_longitude": job.service_longitude,
             "requested_date": job.requested_date,
             "requested_time_start": job.requested_time_start,
-            "task": {
-                "id": task.id if task else None,
-                "name": task.name if task else "Unknown",
-                "level": task.level.value if task else "1",
-                "category_name": (
-                    task.category.name if task and task.category else None
-                ),
+            "task": task or {
+                "id": None,
+                "name": "Unknown",
+                "level": "1",
+                "category_name": None,
             },
             "customer": {
                 "id": customer.id if customer else None,
@@ -391,6 +475,25 @@ async def get_pending_offers(
 # Accept / reject offer
 # ---------------------------------------------------------------------------
 
+async def _raise_offer_unavailable(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    provider_id: uuid.UUID,
+) -> NoReturn:
+    """Explain why a conditional offer UPDATE matched no row.
+
+    Only runs on the failure path, so the happy path stays one statement.
+    """
+    stmt = select(JobAssignment.id).where(
+        JobAssignment.job_id == job_id,
+        JobAssignment.provider_id == provider_id,
+    )
+    assignment_id = (await db.execute(stmt)).scalars().first()
+    if assignment_id is None:
+        raise OfferNotFoundError(job_id, provider_id)
+    raise OfferAlreadyRespondedError(assignment_id)
+
+
 async def accept_offer(
     db: AsyncSession,
     job_id: uuid.UUID,
@@ -404,31 +507,58 @@ async def accept_offer(
         OfferNotFoundError: If no pending offer exists.
         OfferAlreadyRespondedError: If the offer was already handled.
     """
-    stmt = select(JobAssignment).where(
-        JobAssignment.job_id == job_id,
-        JobAssignment.provider_id == provider_id,
+    # Conditional UPDATE ... RETURNING: the OFFERED check and the write are
+    # one statement, so two racing responses cannot both succeed.  The job
+    # status move rides along as a second writable CTE, keyed off the
+    # accepted row, so both mutations cost a single round-trip.
+    #
+    # The job row is locked first by a leading FOR UPDATE CTE that the
+    # assignment UPDATE joins on: an assignment row can only be locked once
+    # the job row has been produced, and so locked.  This matches the
+    # jobs-then-job_assignments order of the socket accept/decline handlers,
+    # so the two paths cannot deadlock on the same offer.
+    locked_job = (
+        select(Job.id)
+        .where(Job.id == job_id)
+        .with_for_update()
+        .cte("locked_job")
     )
-    result = await db.execute(stmt)
-    assignment = result.scalar_one_or_none()
-
+    accepted = (
+        update(JobAssignment)
+        .where(
+            JobAssignment.job_id.in_(select(locked_job.c.id)),
+            JobAssignment.job_id == job_id,
+            JobAssignment.provider_id == provider_id,
+            JobAssignment.status == AssignmentStatus.OFFERED,
+        )
+        .values(
+            status=AssignmentStatus.ACCEPTED,
+            responded_at=datetime.now(timezone.utc),
+            sla_response_met=True,  # They responded
+        )
+        .returning(*JobAssignment.__table__.c)
+        .cte("accepted")
+    )
+    # Bulk UPDATEs bypass the mapper's version counter, so the
+    # optimistic-lock column is bumped explicitly.
+    job_moved = (
+        update(Job)
+        .where(
+            Job.id.in_(select(accepted.c.job_id)),
+            Job.status.in_((JobStatus.MATCHED, JobStatus.PENDING_MATCH)),
+        )
+        .values(status=JobStatus.PROVIDER_ACCEPTED, version=Job.version + 1)
+        .returning(Job.id)
+        .cte("job_moved")
+    )
+    stmt = (
+        select(aliased(JobAssignment, accepted))
+        .add_cte(job_moved)
+        .execution_options(populate_existing=True)
+    )
+    assignment = (await db.execute(stmt)).scalar_one_or_none()
     if assignment is None:
-        raise OfferNotFoundError(job_id, provider_id)
-
-    if assignment.status != AssignmentStatus.OFFERED:
-        raise OfferAlreadyRespondedError(assignment.id)
-
-    now = datetime.now(timezone.utc)
-    assignment.status = AssignmentStatus.ACCEPTED
-    assignment.responded_at = now
-    assignment.sla_response_met = True  # They responded
-
-    # Update job status
-    job_stmt = select(Job).where(Job.id == job_id)
-    job = (await db.execute(job_stmt)).scalar_one_or_none()
-    if job and job.status in (JobStatus.MATCHED, JobStatus.PENDING_MATCH):
-        job.status = JobStatus.PROVIDER_ACCEPTED
-
-    await db.flush()
+        await _raise_offer_unavailable(db, job_id, provider_id)
 
     logger.info(
         "Provider %s accepted offer for job %s (assignment=%s)",
@@ -455,24 +585,22 @@ async def reject_offer(
         OfferNotFoundError: If no pending offer exists.
         OfferAlreadyRespondedError: If the offer was already handled.
     """
-    stmt = select(JobAssignment).where(
-        JobAssignment.job_id == job_id,
-        JobAssignment.provider_id == provider_id,
+    stmt = (
+        update(JobAssignment)
+        .where(
+            JobAssignment.job_id == job_id,
+            JobAssignment.provider_id == provider_id,
+            JobAssignment.status == AssignmentStatus.OFFERED,
+        )
+        .values(
+            status=AssignmentStatus.DECLINED,
+            responded_at=datetime.now(timezone.utc),
+            decline_reason=reason,
+        )
+        .returning(JobAssignment.id)
     )
-    result = await db.execute(stmt)
-    assignment = result.scalar_one_or_none()
-
-    if assignment is None:
-        raise OfferNotFoundError(job_id, provider_id)
-
-    if assignment.status != AssignmentStatus.OFFERED:
-        raise OfferAlreadyRespondedError(assignment.id)
-
-    assignment.status = AssignmentStatus.DECLINED
-    assignment.responded_at = datetime.now(timezone.utc)
-    assignment.decline_reason = reason
-
-    await db.flush()
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
+        await _raise_offer_unavailable(db, job_id, provider_id)
 
     logger.info(
         "Provider %s rejected offer for job %s (reason=%s)",
@@ -740,14 +868,13 @@ async def get_job_tracking(
 ) -> dict[str, Any]:
     """Get real-time tracking info for a job.
 
-    Returns provider location, ETA, and current status.  In production this
-    would read from Redis / a location stream.  For MVP, returns the
-    provider's last known location from the user record.
+    Returns provider location, ETA, and current status.  The location is
+    the provider's live position from Redis (written by the ``/location``
+    socket), falling back to the last known location on the user record.
     """
-    # Load job
-    job_stmt = select(Job).where(Job.id == job_id)
-    job = (await db.execute(job_stmt)).scalar_one_or_none()
-    if job is None:
+    # Load job status/location and the active assignment in one row
+    row = (await db.execute(_TRACKING_ROW_STMT, {"job_id": job_id})).first()
+    if row is None:
         return {
             "provider_lat": None,
             "provider_lng": None,
@@ -757,29 +884,25 @@ async def get_job_tracking(
             "updated_at": None,
         }
 
-    # Find active assignment
-    assignment_stmt = select(JobAssignment).where(
-        JobAssignment.job_id == job_id,
-        JobAssignment.status.in_([
-            AssignmentStatus.ACCEPTED,
-            AssignmentStatus.COMPLETED,
-        ]),
-    )
-    assignment = (await db.execute(assignment_stmt)).scalar_one_or_none()
-
     provider_lat = None
     provider_lng = None
     eta_minutes = None
     provider_name = None
+    # Without a live fix, report when the tracked rows last changed rather
+    # than the render time, so an unchanged payload renders identically and
+    # its body ETag stays valid across polls.
+    updated_at = max(
+        filter(None, (row.job_updated_at, row.assignment_updated_at))
+    )
 
-    if assignment is not None:
+    if row.provider_id is not None:
         # Load provider + user
-        provider_stmt = (
-            select(ProviderProfile)
-            .options(selectinload(ProviderProfile.user))
-            .where(ProviderProfile.id == assignment.provider_id)
-        )
-        provider = (await db.execute(provider_stmt)).scalar_one_or_none()
+        provider = (
+            await db.execute(
+                _PROFILE_WITH_USER_STMT,
+                {"provider_id": row.provider_id},
+            )
+        ).scalar_one_or_none()
 
         if provider and provider.user:
             provider_name = (
@@ -787,28 +910,45 @@ async def get_job_tracking(
                 or f"{provider.user.first_name} {provider.user.last_name}"
             )
 
-            # Use user's last known location (in production: Redis location stream)
-            if provider.user.last_latitude is not None:
+            # Prefer the live GPS fix the /location socket keeps in Redis;
+            # fall back to the user's last known location in the database.
+            try:
+                live = await get_provider_location(provider.user_id)
+            except Exception as exc:
+                logger.warning(
+                    "Live location lookup failed for provider %s: %s",
+                    provider.id,
+                    exc,
+                )
+                live = None
+
+            if live is not None:
+                provider_lat = live.lat
+                provider_lng = live.lng
+                updated_at = live.updated_at
+            elif provider.user.last_latitude is not None:
                 provider_lat = provider.user.last_latitude
                 provider_lng = provider.user.last_longitude
+                updated_at = max(updated_at, provider.user.updated_at)
 
+            if provider_lat is not None:
                 # Rough ETA based on distance
                 distance = haversine_distance(
                     float(provider_lat),
                     float(provider_lng),
-                    float(job.service_latitude),
-                    float(job.service_longitude),
+                    float(row.service_latitude),
+                    float(row.service_longitude),
                 )
                 # Assume average 40 km/h in urban areas
                 eta_minutes = max(1, int(distance / 40 * 60))
-            elif assignment.estimated_arrival_min:
-                eta_minutes = assignment.estimated_arrival_min
+            elif row.estimated_arrival_min:
+                eta_minutes = row.estimated_arrival_min
 
     return {
         "provider_lat": provider_lat,
         "provider_lng": provider_lng,
         "eta_minutes": eta_minutes,
-        "status": job.status.value,
+        "status": row.status.value,
         "provider_name": provider_name,
-        "updated_at": datetime.now(timezone.utc),
+        "updated_at": updated_at,
     }
@@ -0,0 +1,103 @@
+"""
+Taxonomy Cache -- VISP-BE-TAXONOMY-001
+=======================================
+
+Redis-backed read-through cache for the small task summaries (name, level,
+category name) that job and offer payloads embed.  The closed task catalog
+changes only through admin migrations, so summaries are cached for an hour.
+
+Redis keys:
+  - ``visp:taxonomy:task_summary:{task_id}``   JSON task summary (TTL 1h)
+
+Redis failures are logged and fall back to the database; the cache never
+fails a request.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.taxonomy import ServiceCategory, ServiceTask
+from src.realtime.socketServer import get_redis
+
+logger = logging.getLogger(__name__)
+
+_TASK_SUMMARY_PREFIX: str = "visp:taxonomy:task_summary:"
+_TASK_SUMMARY_TTL_SECONDS: int = 3600
+
+
+async def get_task_summaries(
+    db: AsyncSession,
+    task_ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """Return ``{task_id: {"id", "name", "level", "category_name"}}``.
+
+    Cached summaries are fetched with a single MGET; misses are loaded in
+    one joined query and written back with a TTL.  Unknown task IDs are
+    absent from the result.
+    """
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return {}
+
+    keys = [f"{_TASK_SUMMARY_PREFIX}{task_id}" for task_id in ids]
+    try:
+        redis = await get_redis()
+        cached = await redis.mget(keys)
+    except Exception as exc:
+        logger.warning("Task summary cache read failed: %s", exc)
+        redis = None
+        cached = [None] * len(ids)
+
+    summaries: dict[uuid.UUID, dict[str, Any]] = {}
+    misses: list[uuid.UUID] = []
+    for task_id, raw in zip(ids, cached):
+        if raw is None:
+            misses.append(task_id)
+        else:
+            summaries[task_id] = json.loads(raw)
+
+    if not misses:
+        return summaries
+
+    stmt = (
+        select(
+            ServiceTask.id,
+            ServiceTask.name,
+            ServiceTask.level,
+            ServiceCategory.name.label("category_name"),
+        )
+        .outerjoin(ServiceCategory, ServiceTask.category_id == ServiceCategory.id)
+        .where(ServiceTask.id.in_(misses))
+    )
+    fresh: dict[uuid.UUID, dict[str, Any]] = {
+        row.id: {
+            "id": str(row.id),
+            "name": row.name,
+            "level": row.level.value,
+            "category_name": row.category_name,
+        }
+        for row in (await db.execute(stmt)).all()
+    }
+    summaries.update(fresh)
+
+    if redis is not None and fresh:
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for task_id, summary in fresh.items():
+                    pipe.set(
+                        f"{_TASK_SUMMARY_PREFIX}{task_id}",
+                        json.dumps(summary),
+                        ex=_TASK_SUMMARY_TTL_SECONDS,
+                    )
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("Task summary cache write failed: %s", exc)
+
+    return summaries
@@ -24,7 +24,7 @@ from typing import Optional, Sequence
 
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from src.models.provider import ProviderLevel
 from src.models.taxonomy import ServiceCategory, ServiceTask
@@ -308,7 +308,7 @@ async def get_task_by_id(
     loaded, or ``None`` if not found."""
     stmt = (
         select(ServiceTask)
-        .options(selectinload(ServiceTask.category))
+        .options(joinedload(ServiceTask.category))
         .where(ServiceTask.id == task_id)
     )
     result = await db.execute(stmt)
@@ -0,0 +1,284 @@
+"""
+Unit tests for the Job Service -- VISP-BE-JOBS-002.
+
+Tests the mobile booking path, list pagination, and optimistic locking
+on status changes.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm.exc import StaleDataError
+
+from src.core.pagination import decode_cursor, encode_cursor
+from src.models.job import JobStatus
+from src.services import jobService
+
+
+def _estimate(final_min: int = 10000, rate: str = "0.175") -> MagicMock:
+    estimate = MagicMock()
+    estimate.final_price_min_cents = final_min
+    estimate.commission_rate_default = Decimal(rate)
+    return estimate
+
+
+def _session_factory() -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory
+
+
+def _book_kwargs(sample_job) -> dict:
+    return {
+        "customer_id": sample_job.customer_id,
+        "task_id": sample_job.task_id,
+        "location": {"latitude": 43.65, "longitude": -79.38, "address": "1 King St"},
+    }
+
+
+# ---------------------------------------------------------------------------
+# book_job
+# ---------------------------------------------------------------------------
+
+
+class TestBookJob:
+    """Tests for the single-INSERT mobile booking path."""
+
+    @pytest.mark.asyncio
+    async def test_transitions_to_pending_match_and_quotes(self, mock_db, sample_job):
+        sample_job.status = JobStatus.DRAFT
+        with patch.object(
+            jobService, "async_session_factory", _session_factory()
+        ), patch.object(
+            jobService,
+            "_prepare_job",
+            new_callable=AsyncMock,
+            return_value=(sample_job, MagicMock()),
+        ), patch.object(
+            jobService, "calculate_price", new_callable=AsyncMock, return_value=_estimate()
+        ):
+            result = await jobService.book_job(mock_db, **_book_kwargs(sample_job))
+
+        assert result.job is sample_job
+        assert sample_job.status == JobStatus.PENDING_MATCH
+        assert sample_job.quoted_price_cents == 10000
+        assert sample_job.commission_amount_cents == 1750
+        assert sample_job.provider_payout_cents == 8250
+        mock_db.add.assert_called_once_with(sample_job)
+        mock_db.flush.assert_awaited_once()
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pricing_failure_still_books(self, mock_db, sample_job):
+        sample_job.status = JobStatus.DRAFT
+        sample_job.quoted_price_cents = None
+        with patch.object(
+            jobService, "async_session_factory", _session_factory()
+        ), patch.object(
+            jobService,
+            "_prepare_job",
+            new_callable=AsyncMock,
+            return_value=(sample_job, MagicMock()),
+        ), patch.object(
+            jobService,
+            "calculate_price",
+            new_callable=AsyncMock,
+            side_effect=ValueError("no pricing"),
+        ):
+            result = await jobService.book_job(mock_db, **_book_kwargs(sample_job))
+
+        assert result.estimate is None
+        assert sample_job.status == JobStatus.PENDING_MATCH
+        assert sample_job.quoted_price_cents is None
+        mock_db.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quote_runs_on_its_own_session(self, mock_db, sample_job):
+        sample_job.status = JobStatus.DRAFT
+        factory = _session_factory()
+        pricing_db = factory.return_value.__aenter__.return_value
+        with patch.object(jobService, "async_session_factory", factory), patch.object(
+            jobService,
+            "_prepare_job",
+            new_callable=AsyncMock,
+            return_value=(sample_job, MagicMock()),
+        ), patch.object(
+            jobService, "calculate_price", new_callable=AsyncMock, return_value=_estimate()
+        ) as calc:
+            await jobService.book_job(mock_db, **_book_kwargs(sample_job))
+
+        assert calc.await_args.args[0] is pricing_db
+
+    @pytest.mark.asyncio
+    async def test_task_not_found_cancels_quote(self, mock_db, sample_job):
+        quote_started = asyncio.Event()
+        quote_cancelled = asyncio.Event()
+
+        async def pending_quote(*args, **kwargs):
+            quote_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                quote_cancelled.set()
+                raise
+
+        async def missing_task(*args, **kwargs):
+            # Fail only once the quote is in flight, so there is something
+            # to cancel.
+            await quote_started.wait()
+            raise jobService.TaskNotFoundError(sample_job.task_id)
+
+        with patch.object(
+            jobService, "async_session_factory", _session_factory()
+        ), patch.object(
+            jobService, "_prepare_job", side_effect=missing_task
+        ), patch.object(
+            jobService, "calculate_price", side_effect=pending_quote
+        ):
+            with pytest.raises(jobService.TaskNotFoundError):
+                await jobService.book_job(mock_db, **_book_kwargs(sample_job))
+            await asyncio.wait_for(quote_cancelled.wait(), timeout=1)
+
+        assert quote_cancelled.is_set()
+        mock_db.flush.assert_not_called()
+
+    def test_commission_matches_decimal_truncation(self):
+        for cents, rate in [(10000, "0.175"), (9999, "0.15"), (12345, "0.2"), (1, "0.3333")]:
+            expected = int(Decimal(cents) * Decimal(rate))
+            assert jobService._commission_cents(cents, Decimal(rate)) == expected
+
+
+# ---------------------------------------------------------------------------
+# _paginate_jobs
+# ---------------------------------------------------------------------------
+
+
+def _rows_result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+class TestPaginateJobs:
+    """Tests for the single-round-trip page + total-count query."""
+
+    @pytest.mark.asyncio
+    async def test_total_comes_from_window_column(self, mock_db, sample_job):
+        row = MagicMock()
+        row.__getitem__.side_effect = lambda i: sample_job
+        row.total_items = 42
+        mock_db.execute.return_value = _rows_result([row])
+
+        result = await jobService._paginate_jobs(mock_db, [], page=1, page_size=20)
+
+        assert result.items == [sample_job]
+        assert result.total_items == 42
+        assert result.total_pages == 3
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_first_page_skips_count(self, mock_db):
+        mock_db.execute.return_value = _rows_result([])
+
+        result = await jobService._paginate_jobs(mock_db, [], page=1, page_size=20)
+
+        assert result.total_items == 0
+        assert mock_db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_page_past_end_falls_back_to_count(self, mock_db):
+        count_result = MagicMock()
+        count_result.scalar_one.return_value = 25
+        mock_db.execute.side_effect = [_rows_result([]), count_result]
+
+        result = await jobService._paginate_jobs(mock_db, [], page=5, page_size=20)
+
+        assert result.items == []
+        assert result.total_items == 25
+        assert mock_db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_points_at_last_row(self, mock_db, sample_job):
+        row = MagicMock()
+        row.__getitem__.side_effect = lambda i: sample_job
+        row.total_items = 2
+        mock_db.execute.return_value = _rows_result([row])
+
+        result = await jobService._paginate_jobs(mock_db, [], page=1, page_size=1)
+
+        assert decode_cursor(result.next_cursor) == (
+            sample_job.created_at,
+            sample_job.id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, mock_db, sample_job):
+        row = MagicMock()
+        row.__getitem__.side_effect = lambda i: sample_job
+        row.total_items = 1
+        mock_db.execute.return_value = _rows_result([row])
+
+        result = await jobService._paginate_jobs(
+            mock_db,
+            [],
+            page=1,
+            page_size=20,
+            cursor=encode_cursor(sample_job.created_at, sample_job.id),
+        )
+
+        assert result.next_cursor is None
+
+    def test_malformed_cursor_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+# ---------------------------------------------------------------------------
+# Optimistic locking
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentStatusChange:
+    """Lost races (stale version or locked row) raise ConcurrentUpdateError."""
+
+    @pytest.mark.asyncio
+    async def test_update_status_stale_row(self, mock_db, sample_job):
+        sample_job.status = JobStatus.PENDING_MATCH
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = sample_job
+        mock_db.execute.return_value = result
+        mock_db.flush.side_effect = StaleDataError("0 rows matched")
+
+        with pytest.raises(jobService.ConcurrentUpdateError):
+            await jobService.update_job_status(
+                mock_db, sample_job.id, "cancelled_by_system", actor_type="system"
+            )
+
+    @pytest.mark.asyncio
+    async def test_cancel_stale_row(self, mock_db, sample_job):
+        sample_job.status = JobStatus.PENDING_MATCH
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = sample_job
+        mock_db.execute.return_value = result
+        mock_db.flush.side_effect = StaleDataError("0 rows matched")
+
+        with pytest.raises(jobService.ConcurrentUpdateError):
+            await jobService.cancel_job(
+                mock_db, sample_job.id, cancelled_by=sample_job.customer_id
+            )
+
+    @pytest.mark.asyncio
+    async def test_locked_row_fails_fast(self, mock_db, sample_job):
+        orig = Exception("could not obtain lock on row")
+        orig.sqlstate = "55P03"
+        mock_db.execute.side_effect = DBAPIError("SELECT", {}, orig)
+
+        with pytest.raises(jobService.ConcurrentUpdateError):
+            await jobService.update_job_status(
+                mock_db, sample_job.id, "cancelled_by_system", actor_type="system"
+            )
+        mock_db.flush.assert_not_called()
@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.api.schemas.matching import MatchResult
 from src.models.provider import (
     BackgroundCheckStatus,
     ProviderLevel,
@@ -613,3 +614,53 @@ class TestEmptyResults:
 
         assert result["matches"] == []
         assert result["total_qualified"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Match result types
+# ---------------------------------------------------------------------------
+
+
+class TestMatchResultTypes:
+    """The /matching/find route builds MatchResult with model_construct, so
+    the engine's match dicts must already carry the schema's field types."""
+
+    @pytest.mark.asyncio
+    async def test_matches_are_already_schema_typed(
+        self, mock_db, sample_job, sample_provider
+    ):
+        task_result = MagicMock()
+        task_result.scalar_one_or_none.return_value = sample_job.task
+
+        provider_scalars = MagicMock()
+        provider_scalars.all.return_value = [sample_provider]
+        provider_result = MagicMock()
+        provider_result.scalars.return_value = provider_scalars
+
+        mock_db.execute.side_effect = [task_result, provider_result]
+
+        from src.services.geoService import ProviderDistance
+
+        qualified = {
+            "provider": sample_provider,
+            "distance_km": 5.0,
+            "has_license": False,
+            "has_insurance": True,
+            "on_call_active": False,
+        }
+        with patch(
+            "src.services.matchingEngine.filter_by_radius",
+            return_value=[ProviderDistance(provider=sample_provider, distance_km=5.0)],
+        ), patch(
+            "src.services.matchingEngine._evaluate_candidate",
+            AsyncMock(return_value=qualified),
+        ):
+            result = await find_matching_providers(mock_db, sample_job)
+
+        assert len(result["matches"]) == 1
+        match = result["matches"][0]
+        validated = MatchResult.model_validate(match)
+        constructed = MatchResult.model_construct(**match)
+        for name in MatchResult.model_fields:
+            assert type(getattr(constructed, name)) is type(getattr(validated, name)), name
+        assert constructed.model_dump_json() == validated.model_dump_json()
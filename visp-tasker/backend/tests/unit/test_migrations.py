@@ -0,0 +1,28 @@
+"""
+Unit tests for the raw SQL migrations.
+
+Checks that enum types created by the migrations carry the labels the ORM
+models actually write.
+"""
+
+import re
+from pathlib import Path
+
+from src.models.notification import Notification
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+def _enum_labels(filename: str, type_name: str) -> list[str]:
+    sql = (_MIGRATIONS_DIR / filename).read_text()
+    match = re.search(
+        rf"CREATE TYPE {type_name} AS ENUM \((.*?)\);", sql, re.DOTALL
+    )
+    assert match is not None, f"{type_name} not created in {filename}"
+    return re.findall(r"'([^']*)'", match.group(1))
+
+
+class TestNotificationTypeEnum:
+    def test_labels_match_model(self):
+        labels = _enum_labels("013_create_notifications.sql", "notification_type")
+        assert labels == list(Notification.__table__.c.notification_type.type.enums)
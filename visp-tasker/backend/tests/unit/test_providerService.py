@@ -0,0 +1,24 @@
+"""
+Unit tests for the Provider Service -- VISP-BE-JOBS-002 provider endpoints.
+
+Tests the payout estimate shown on pending offers.
+"""
+
+from decimal import Decimal
+
+from src.services import providerService
+
+
+class TestEstimatedPayout:
+    def test_matches_price_minus_truncated_commission(self):
+        for cents, rate in [(10000, "0.175"), (9999, "0.15"), (12345, "0.2"), (1, "0.3333")]:
+            commission = int(Decimal(cents) * Decimal(rate))
+            assert (
+                providerService._estimated_payout_cents(cents, Decimal(rate))
+                == cents - commission
+            )
+
+    def test_no_float_drift_just_below_whole_cent(self):
+        # 0.1 * 2999 = 299.9 -> commission truncates to 299; a float path
+        # computing int(2999 * 0.9) yields 2699 instead of 2700.
+        assert providerService._estimated_payout_cents(2999, Decimal("0.1")) == 2700
@@ -0,0 +1,117 @@
+"""
+Unit tests for the shared API response helpers.
+
+Tests the ``{"data": ...}`` envelope rendering and the ETag /
+``If-None-Match`` handling used by polled endpoints.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.api.responses import (
+    body_etag,
+    conditional_json_response,
+    not_modified,
+    render_data,
+    version_etag,
+)
+from src.api.schemas.job import JobOut
+
+
+def _request(if_none_match: str | None = None) -> MagicMock:
+    request = MagicMock()
+    request.headers = {} if if_none_match is None else {"if-none-match": if_none_match}
+    return request
+
+
+class TestRenderData:
+    def test_wraps_payload_in_data_envelope(self):
+        assert render_data({"status": "ok"}) == b'{"data":{"status":"ok"}}'
+
+    def test_none_payload(self):
+        assert render_data(None) == b'{"data":null}'
+
+    def test_utc_datetimes_use_z_suffix(self):
+        when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert render_data({"at": when}) == b'{"data":{"at":"2026-01-01T00:00:00Z"}}'
+
+    def test_job_coordinates_render_as_numbers(self):
+        when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        job = JobOut(
+            id=uuid.uuid4(),
+            reference_number="TSK-000001",
+            customer_id=uuid.uuid4(),
+            task_id=uuid.uuid4(),
+            status="pending_match",
+            priority="standard",
+            is_emergency=False,
+            service_latitude=Decimal("43.6532000"),
+            service_longitude=Decimal("-79.3832000"),
+            service_address="1 Front St",
+            service_country="CA",
+            flexible_schedule=False,
+            currency="CAD",
+            created_at=when,
+            updated_at=when,
+        )
+        rendered = json.loads(render_data({"job": job}))["data"]["job"]
+        assert rendered["service_latitude"] == 43.6532
+        assert rendered["service_longitude"] == -79.3832
+
+
+class TestConditionalJsonResponse:
+    body = b'{"data":{"status":"in_progress"}}'
+
+    def test_sets_weak_etag_on_full_response(self):
+        response = conditional_json_response(_request(), self.body)
+        assert response.status_code == 200
+        assert response.body == self.body
+        assert response.headers["etag"] == body_etag(self.body)
+        assert response.headers["etag"].startswith('W/"')
+
+    def test_matching_etag_returns_304_without_body(self):
+        etag = body_etag(self.body)
+        response = conditional_json_response(_request(etag), self.body)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    def test_strong_form_of_etag_still_matches(self):
+        strong = body_etag(self.body).removeprefix("W/")
+        response = conditional_json_response(_request(f'"other", {strong}'), self.body)
+        assert response.status_code == 304
+
+    def test_stale_etag_returns_full_body(self):
+        stale = body_etag(b'{"data":{"status":"provider_en_route"}}')
+        response = conditional_json_response(_request(stale), self.body)
+        assert response.status_code == 200
+        assert response.body == self.body
+
+    def test_wildcard_matches(self):
+        response = conditional_json_response(_request("*"), self.body)
+        assert response.status_code == 304
+
+    def test_explicit_etag_overrides_body_hash(self):
+        etag = version_etag("2026-01-01T00:00:00+00:00", 3)
+        response = conditional_json_response(_request(), self.body, etag=etag)
+        assert response.headers["etag"] == etag
+
+
+class TestVersionEtag:
+    def test_same_parts_same_etag(self):
+        assert version_etag("a", 1, None) == version_etag("a", 1, None)
+
+    def test_any_part_change_changes_etag(self):
+        assert version_etag("a", 1) != version_etag("a", 2)
+        assert version_etag("a", 1) != version_etag("b", 1)
+
+    def test_not_modified_only_on_match(self):
+        etag = version_etag("a", 1)
+        assert not_modified(_request(), etag) is None
+        assert not_modified(_request(version_etag("a", 2)), etag) is None
+        response = not_modified(_request(etag), etag)
+        assert response is not None
+        assert response.status_code == 304
@@ -0,0 +1,98 @@
+"""
+Unit tests for the Taxonomy Cache -- VISP-BE-TAXONOMY-001.
+
+Tests the Redis read-through path for task summaries.
+"""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.provider import ProviderLevel
+from src.services import taxonomyCache
+
+
+class _FakePipeline:
+    def __init__(self, store: dict[str, str]) -> None:
+        self._store = store
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self._store[key] = value
+
+    async def execute(self) -> None:
+        return None
+
+
+class _FakeRedis:
+    def __init__(self, store: dict[str, str] | None = None) -> None:
+        self.store = store or {}
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.store)
+
+
+def _row(task_id: uuid.UUID) -> MagicMock:
+    row = MagicMock()
+    row.id = task_id
+    row.name = "Faucet repair"
+    row.level = ProviderLevel.LEVEL_1
+    row.category_name = "Plumbing"
+    return row
+
+
+class TestGetTaskSummaries:
+    """Tests for the MGET + single-query miss path."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_once_and_writes_back(self, mock_db):
+        task_id = uuid.uuid4()
+        redis = _FakeRedis()
+        result = MagicMock()
+        result.all.return_value = [_row(task_id)]
+        mock_db.execute.return_value = result
+
+        with patch.object(taxonomyCache, "get_redis", AsyncMock(return_value=redis)):
+            summaries = await taxonomyCache.get_task_summaries(
+                mock_db, [task_id, task_id]
+            )
+
+        assert summaries[task_id]["category_name"] == "Plumbing"
+        assert mock_db.execute.await_count == 1
+        assert f"visp:taxonomy:task_summary:{task_id}" in redis.store
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_database(self, mock_db):
+        task_id = uuid.uuid4()
+        cached = {"id": str(task_id), "name": "x", "level": "1", "category_name": None}
+        redis = _FakeRedis({f"visp:taxonomy:task_summary:{task_id}": json.dumps(cached)})
+
+        with patch.object(taxonomyCache, "get_redis", AsyncMock(return_value=redis)):
+            summaries = await taxonomyCache.get_task_summaries(mock_db, [task_id])
+
+        assert summaries == {task_id: cached}
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_down_falls_back_to_database(self, mock_db):
+        task_id = uuid.uuid4()
+        result = MagicMock()
+        result.all.return_value = [_row(task_id)]
+        mock_db.execute.return_value = result
+
+        with patch.object(
+            taxonomyCache, "get_redis", AsyncMock(side_effect=ConnectionError("down"))
+        ):
+            summaries = await taxonomyCache.get_task_summaries(mock_db, [task_id])
+
+        assert summaries[task_id]["name"] == "Faucet repair"